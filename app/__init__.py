@@ -5,18 +5,23 @@ Flask application factory and initialization.
 
 import os
 from flask import Flask, send_from_directory
-from jinja2 import ChoiceLoader, FileSystemLoader
+from jinja2 import FileSystemLoader, FileSystemBytecodeCache
 from app.config import get_config
 from app.logger import setup_logger
 from app.errors import register_error_handlers
-from app.modules import auth_bp, admin_bp, public_bp
-from app.blueprints.import_export import import_export_bp
-from app.core import ensure_directories
-from app.core.site_manager import SiteManager
-from app.cache.utils import CacheFactory, CacheService
-from app.modules.admin.cache_routes import cache_bp, set_cache_service
-from app.modules.admin.plugin_routes import plugin_bp
-from app.plugins import init_plugins, get_plugin_manager
+from app.sessions import init_session_interface
+from app.template_loader import CachingChoiceLoader
+
+
+# Project paths, resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_APP_TEMPLATES = os.path.join(_PROJECT_ROOT, "app", "templates")
+_ENGINE_TEMPLATES = os.path.join(_PROJECT_ROOT, "templates")
+_STATIC_FOLDER = os.path.join(_PROJECT_ROOT, "static")
+
+# Cache services by backend type, shared by every app created in this
+# process so repeated create_app() calls (tests, reloads) keep warm caches
+_CACHE_SERVICES = {}
 
 
 def create_app(config=None):
@@ -35,19 +40,26 @@ def create_app(config=None):
     Returns:
         Configured Flask application instance
     """
-    # Create Flask app instance
-    project_root = os.path.dirname(os.path.dirname(__file__))
-    app_templates = os.path.abspath(os.path.join(project_root, "app", "templates"))
-    engine_templates = os.path.abspath(os.path.join(project_root, "templates"))
-    static_folder = os.path.join(project_root, "static")
+    # Blueprints, cache and plugin systems are imported here rather than at
+    # module level, so CLI commands that import the app package do not load
+    # the whole web stack
+    from app.modules import auth_bp, admin_bp, public_bp
+    from app.modules.public import register_page_routes
+    from app.blueprints.import_export import import_export_bp
+    from app.core import ensure_directories
+    from app.core.site_manager import SiteManager
+    from app.cache.utils import CacheFactory, CacheService
+    from app.modules.admin.cache_routes import cache_bp, set_cache_service
+    from app.modules.admin.plugin_routes import plugin_bp
+    from app.plugins import init_plugins
 
+    # Create Flask app instance
     # Use app templates as default so admin/* always resolves, even if loader override fails.
-    template_folder = app_templates
     app = Flask(
         __name__,
         instance_relative_config=False,
-        template_folder=template_folder,
-        static_folder=static_folder,
+        template_folder=_APP_TEMPLATES,
+        static_folder=_STATIC_FOLDER,
     )
 
     # Load configuration
@@ -56,10 +68,17 @@ def create_app(config=None):
 
     app.config.from_object(config)
 
+    # Flask 2.3+ reads JSON options from the provider, not from app.config
+    app.json.sort_keys = app.config.get("JSON_SORT_KEYS", False)
+    app.json.compact = not app.config.get("JSONIFY_PRETTYPRINT_REGULAR", False)
+
     # Setup logging
     setup_logger(app)
     app.logger.info("Application factory initialized")
 
+    # Serialize session cookies with orjson when available
+    init_session_interface(app)
+
     # Initialize SiteManager for ECS (Engine-Content Separation)
     app.logger.info("Initializing SiteManager...")
     try:
@@ -73,8 +92,8 @@ def create_app(config=None):
         app.site_manager = site_manager
 
         app.logger.info(
-            f"SiteManager initialized (legacy_mode={legacy_mode}, "
-            f"sites_dir={sites_dir}, default_site={default_site})"
+            "SiteManager initialized (legacy_mode=%s, sites_dir=%s, default_site=%s)",
+            legacy_mode, sites_dir, default_site,
         )
 
         # Ensure site directory structure exists
@@ -94,7 +113,7 @@ def create_app(config=None):
     # Configure Jinja2 ChoiceLoader (always include app templates for admin/*)
     app.logger.info("Configuring Jinja2 ChoiceLoader...")
     try:
-        loader_paths = [app_templates]
+        loader_paths = [_APP_TEMPLATES]
 
         if not app.site_manager.legacy_mode:
             site_templates = os.path.abspath(app.site_manager.get_templates_dir())
@@ -103,37 +122,51 @@ def create_app(config=None):
         else:
             app.logger.info("Legacy mode detected: skipping site templates loader")
 
-        loader_paths.append(engine_templates)
+        loader_paths.append(_ENGINE_TEMPLATES)
 
         for path in loader_paths:
             if not os.path.isdir(path):
                 app.logger.warning(f"Template directory not found: {path}")
 
-        app.jinja_loader = ChoiceLoader(
+        app.jinja_loader = CachingChoiceLoader(
             [FileSystemLoader(path) for path in loader_paths]
         )
-        app.logger.info(f"Jinja2 ChoiceLoader configured with paths: {loader_paths}")
+        app.logger.info("Jinja2 ChoiceLoader configured with paths: %s", loader_paths)
 
     except Exception as e:
         app.logger.error(f"Failed to configure Jinja2 ChoiceLoader: {str(e)}")
 
+    # Persist compiled template bytecode so workers skip parsing and compiling
+    jinja_cache_dir = app.config.get("JINJA_CACHE_DIR")
+    if jinja_cache_dir:
+        try:
+            os.makedirs(jinja_cache_dir, exist_ok=True)
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
+            app.logger.info("Jinja2 bytecode cache enabled: %s", jinja_cache_dir)
+        except Exception as e:
+            app.logger.warning(f"Jinja2 bytecode cache unavailable: {str(e)}")
+
     # Initialize caching system
     app.logger.info("Initializing cache system...")
     cache_backend_type = os.environ.get("CACHE_BACKEND", "memory").lower()
     try:
-        cache_manager = CacheFactory.create_manager(cache_backend_type)
-        cache_service = CacheService(cache_manager)
+        cache_service = _CACHE_SERVICES.get(cache_backend_type)
+        if cache_service is None:
+            cache_manager = CacheFactory.create_manager(cache_backend_type)
+            cache_service = CacheService(cache_manager)
 
-        # Enable cache components
-        cache_service.enable_template_caching(default_ttl=3600)
-        cache_service.enable_response_caching(default_ttl=3600, max_age=3600)
-        cache_service.enable_config_caching(cache_ttl=300)
+            # Enable cache components
+            cache_service.enable_template_caching(default_ttl=3600)
+            cache_service.enable_response_caching(default_ttl=3600, max_age=3600)
+            cache_service.enable_config_caching(cache_ttl=300)
+
+            _CACHE_SERVICES[cache_backend_type] = cache_service
 
         # Store cache service in app context
         app.cache_service = cache_service
         set_cache_service(cache_service)
 
-        app.logger.info(f"Cache system initialized with backend: {cache_backend_type}")
+        app.logger.info("Cache system initialized with backend: %s", cache_backend_type)
     except Exception as e:
         app.logger.warning(f"Cache system initialization failed: {str(e)}")
         app.cache_service = None
@@ -145,7 +178,7 @@ def create_app(config=None):
 
         # Load all enabled plugins
         loaded_plugins = plugin_manager.load_all()
-        app.logger.info(f"Loaded {len(loaded_plugins)} plugins")
+        app.logger.info("Loaded %d plugins", len(loaded_plugins))
 
         # Register plugin-defined template filters
         _register_plugin_template_filters(app, plugin_manager)
@@ -160,14 +193,11 @@ def create_app(config=None):
 
     # Register blueprints
     app.logger.info("Registering blueprints...")
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(admin_bp)
-    app.register_blueprint(import_export_bp)
-    app.register_blueprint(public_bp)
-    if app.cache_service:
-        app.register_blueprint(cache_bp)
-    app.register_blueprint(plugin_bp)
-    app.logger.info(f"Registered {len(app.blueprints)} blueprints")
+    blueprints = (auth_bp, admin_bp, import_export_bp, public_bp,
+                  *((cache_bp,) if app.cache_service else ()), plugin_bp)
+    for blueprint in blueprints:
+        app.register_blueprint(blueprint)
+    app.logger.info("Registered %d blueprints", len(app.blueprints))
 
     # Register error handlers
     app.logger.info("Registering error handlers...")
@@ -175,6 +205,12 @@ def create_app(config=None):
 
     # Register site static route for sites mode (ECS-03)
     if not app.site_manager.legacy_mode:
+        from werkzeug.exceptions import NotFound
+
+        static_max_age = app.config.get("SITE_STATIC_MAX_AGE", 3600)
+        # Sites confirmed to exist. A site deleted later loses its static
+        # directory too, so its files still 404.
+        known_sites = set()
 
         @app.route("/sites/<site_id>/static/<path:filename>")
         def site_static(site_id, filename):
@@ -189,19 +225,25 @@ def create_app(config=None):
                 filename: Path to static file relative to site's static directory
 
             Returns:
-                Static file or 404 if not found
+                Static file (304 when the client copy is current) or 404 if not found
             """
-            try:
-                static_dir = app.site_manager.get_static_dir(site_id)
-
-                # Security check: ensure site exists
+            # Security check: ensure site exists (checked once per site)
+            if site_id not in known_sites:
                 if not app.site_manager.site_exists(site_id):
                     app.logger.warning(
                         f"Attempt to access non-existent site: {site_id}"
                     )
                     return "Site not found", 404
+                known_sites.add(site_id)
 
-                return send_from_directory(static_dir, filename)
+            try:
+                # Relative directories would be resolved against the app package
+                static_dir = os.path.abspath(app.site_manager.get_static_dir(site_id))
+                return send_from_directory(
+                    static_dir, filename, max_age=static_max_age, conditional=True
+                )
+            except NotFound:
+                return "File not found", 404
             except Exception as e:
                 app.logger.error(
                     f"Error serving static file for site {site_id}: {str(e)}"
@@ -210,6 +252,42 @@ def create_app(config=None):
 
         app.logger.info("Site static route registered")
 
+    # Serve uploaded images with long-lived cache headers; upload names change
+    # whenever their content does, so a cached copy never goes stale
+    upload_max_age = app.config.get("UPLOAD_MAX_AGE", 31536000)
+
+    @app.route("/static/images/uploads/<path:filename>")
+    def uploads(filename):
+        """
+        Serve uploaded images from the active site's uploads directory.
+
+        Args:
+            filename: Upload filename
+
+        Returns:
+            Image file (304 when the client copy is current) or 404
+        """
+        upload_dir = os.path.abspath(app.site_manager.get_uploads_dir())
+        response = send_from_directory(
+            upload_dir, filename, max_age=upload_max_age, conditional=True
+        )
+        response.headers["Cache-Control"] = (
+            f"public, max-age={upload_max_age}, immutable"
+        )
+        return response
+
+    # Register configured pages as concrete routes; the public catch-all
+    # still serves pages added after startup
+    try:
+        page_routes = register_page_routes(app)
+        app.logger.info("Registered %d page routes", page_routes)
+    except Exception as e:
+        app.logger.warning(f"Page route registration failed: {str(e)}")
+
+    # Compile every template now (after plugin filters are registered) so the
+    # first request of each worker does not pay for it
+    _prewarm_templates(app)
+
     app.logger.info("===== Application Factory Complete =====")
 
     return app
@@ -229,13 +307,16 @@ def _register_plugin_template_filters(app, plugin_manager):
             "register_template_filters"
         )
 
-        # Merge all filter dictionaries
+        # Merge all filter dictionaries, later plugins overriding earlier ones
+        merged = {}
         for filters in filters_list:
             if filters and isinstance(filters, dict):
-                for filter_name, filter_func in filters.items():
-                    if callable(filter_func):
-                        app.jinja_env.filters[filter_name] = filter_func
-                        app.logger.debug(f"Registered template filter: {filter_name}")
+                merged.update(
+                    (name, func) for name, func in filters.items() if callable(func)
+                )
+        app.jinja_env.filters.update(merged)
+        if merged:
+            app.logger.debug("Registered template filters: %s", ", ".join(merged))
     except Exception as e:
         app.logger.error(f"Error registering plugin template filters: {str(e)}")
 
@@ -254,11 +335,38 @@ def _register_plugin_template_globals(app, plugin_manager):
             "register_template_globals"
         )
 
-        # Merge all global dictionaries
+        # Merge all global dictionaries, later plugins overriding earlier ones
+        merged = {}
         for globals_dict in globals_list:
             if globals_dict and isinstance(globals_dict, dict):
-                for global_name, global_value in globals_dict.items():
-                    app.jinja_env.globals[global_name] = global_value
-                    app.logger.debug(f"Registered template global: {global_name}")
+                merged.update(globals_dict)
+        app.jinja_env.globals.update(merged)
+        if merged:
+            app.logger.debug("Registered template globals: %s", ", ".join(merged))
     except Exception as e:
         app.logger.error(f"Error registering plugin template globals: {str(e)}")
+
+
+def _prewarm_templates(app):
+    """
+    Load and compile all templates visible to the Jinja2 loader.
+
+    Args:
+        app: Flask application instance
+    """
+    env = app.jinja_env
+    compiled = 0
+    try:
+        template_names = env.list_templates()
+    except Exception as e:
+        app.logger.warning(f"Could not list templates for prewarming: {str(e)}")
+        return
+
+    for template_name in template_names:
+        try:
+            env.get_template(template_name)
+            compiled += 1
+        except Exception as e:
+            app.logger.debug("Template prewarm skipped %s: %s", template_name, e)
+
+    app.logger.info("Prewarmed %d templates", compiled)
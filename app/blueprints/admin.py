@@ -8,6 +8,7 @@ from flask import (
 )
 from werkzeug.security import check_password_hash, generate_password_hash
 from datetime import datetime
+from functools import wraps
 import os
 import uuid
 
@@ -21,11 +22,11 @@ admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
 def login_required(f):
     """Decorator to check if user is logged in."""
+    @wraps(f)
     def decorated_function(*args, **kwargs):
         if not session.get('admin_logged_in'):
             return redirect(url_for('admin.login'))
         return f(*args, **kwargs)
-    decorated_function.__name__ = f.__name__
     return decorated_function
 
 
@@ -11,30 +11,152 @@ Handles:
 import os
 import json
 import io
+import re
+import secrets
+import shutil
+import tempfile
+import time
+import zipfile
 from datetime import datetime
-from functools import wraps
 
 from flask import (
     Blueprint, render_template, request, redirect, url_for, session, flash,
-    current_app, send_file, jsonify
+    current_app, send_file, send_from_directory, jsonify
 )
 from werkzeug.utils import secure_filename
 
+from app.core.config_manager import ConfigManager
+from app.core.file_manager import UPLOAD_CHUNK_SIZE
+from app.modules.auth.utils import require_admin_login
 from app.modules.import_export import Exporter, Importer, VersionMigrator
 
 
 # Create blueprint
 import_export_bp = Blueprint('import_export', __name__, url_prefix='/admin/import-export')
 
+# Every route in this blueprint requires an admin login
+import_export_bp.before_request(require_admin_login)
+
+# Uploaded packages waiting for preview/confirm are stored in the temp
+# directory as <prefix><token>.zip. Only the random token goes into the
+# session, and any worker process can find the file from it.
+_PENDING_IMPORT_PREFIX = 'wicara_import_'
+_PENDING_IMPORT_TTL = 15 * 60  # seconds
+_PENDING_IMPORT_TOKEN_RE = re.compile(r'[A-Za-z0-9_-]{16,64}')
+
+# Export modes and import conflict strategies: accepted values and the
+# (value, label) choices shown in the wizards
+_VALID_EXPORT_MODES = frozenset({
+    Exporter.EXPORT_FULL, Exporter.EXPORT_PARTIAL, Exporter.EXPORT_CONTENT
+})
+_EXPORT_MODE_CHOICES = (
+    ('full', 'Full Export (All files)'),
+    ('partial', 'Partial Export (Config + Templates)'),
+    ('content', 'Content Only (Config only)'),
+)
+_VALID_CONFLICT_STRATEGIES = frozenset({'merge', 'replace', 'skip'})
+_CONFLICT_STRATEGY_CHOICES = (
+    ('merge', 'Merge (Keep existing pages)'),
+    ('replace', 'Replace (Overwrite all)'),
+    ('skip', 'Skip (No conflicts)'),
+)
+
+
+def _load_site_config(readonly=False):
+    """
+    Load the current site configuration through the shared config cache.
+
+    Args:
+        readonly: Return the cached dictionary itself; callers must not mutate it
+
+    Returns:
+        Configuration dictionary, or an empty dictionary if it cannot be loaded
+    """
+    config_manager = ConfigManager(
+        config_file=current_app.config['CONFIG_FILE'],
+        site_manager=getattr(current_app, 'site_manager', None),
+        logger=current_app.logger
+    )
+    return config_manager.load(validate=False, readonly=readonly) or {}
+
+
+def _save_upload_to_temp(file):
+    """
+    Copy an uploaded package to a temporary .zip file.
+
+    The upload stream is copied in UPLOAD_CHUNK_SIZE blocks into the already
+    open temporary file, instead of reopening it by name with file.save().
+
+    Args:
+        file: Uploaded file object (werkzeug FileStorage)
+
+    Returns:
+        Path to the temporary file; the caller removes it
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp:
+        shutil.copyfileobj(file.stream, tmp, UPLOAD_CHUNK_SIZE)
+        return tmp.name
+
 
-def login_required(f):
-    """Decorator to check if user is logged in."""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not session.get('admin_logged_in'):
-            return redirect(url_for('admin.login'))
-        return f(*args, **kwargs)
-    return decorated_function
+def _pending_import_path(token):
+    """
+    Get the temp file path of a pending import.
+
+    Args:
+        token: Token from the session (may be None)
+
+    Returns:
+        Path to the package, or None if the token is missing or malformed
+    """
+    if not token or not _PENDING_IMPORT_TOKEN_RE.fullmatch(token):
+        return None
+    return os.path.join(tempfile.gettempdir(), f'{_PENDING_IMPORT_PREFIX}{token}.zip')
+
+
+def _remove_stale_pending_imports():
+    """Delete pending import packages older than _PENDING_IMPORT_TTL."""
+    cutoff = time.time() - _PENDING_IMPORT_TTL
+    try:
+        with os.scandir(tempfile.gettempdir()) as entries:
+            for entry in entries:
+                if not entry.name.startswith(_PENDING_IMPORT_PREFIX):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+    except OSError as e:
+        current_app.logger.debug(f'Pending import cleanup error: {e}')
+
+
+def _save_pending_import(file):
+    """
+    Store an uploaded package until the import is confirmed.
+
+    Args:
+        file: Uploaded file object (werkzeug FileStorage)
+
+    Returns:
+        Tuple of (token, path)
+    """
+    _remove_stale_pending_imports()
+    token = secrets.token_urlsafe(16)
+    path = _pending_import_path(token)
+    with open(path, 'xb') as f:
+        shutil.copyfileobj(file.stream, f, UPLOAD_CHUNK_SIZE)
+    return token, path
+
+
+def _discard_pending_import():
+    """Remove the session's pending import package and its session keys."""
+    path = _pending_import_path(session.pop('import_token', None))
+    session.pop('import_filename', None)
+    if path:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
 
 
 # ============================================================================
@@ -42,7 +164,6 @@ def login_required(f):
 # ============================================================================
 
 @import_export_bp.route('/export', methods=['GET', 'POST'])
-@login_required
 def export_page():
     """Export wizard page."""
     if request.method == 'POST':
@@ -52,18 +173,12 @@ def export_page():
             include_templates = request.form.getlist('templates')
 
             # Validate mode
-            valid_modes = [Exporter.EXPORT_FULL, Exporter.EXPORT_PARTIAL, Exporter.EXPORT_CONTENT]
-            if mode not in valid_modes:
+            if mode not in _VALID_EXPORT_MODES:
                 flash(f'Invalid export mode: {mode}', 'error')
                 return redirect(url_for('import_export.export_page'))
 
-            # Load config for hook
-            config_path = current_app.config['CONFIG_FILE']
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            except:
-                config = {}
+            # Load config for hook (a copy, plugins may modify it)
+            config = _load_site_config()
 
             # Execute before_export hook
             try:
@@ -82,6 +197,7 @@ def export_page():
             filename = f"wicara_export_{timestamp}.zip"
 
             # Create exporter with SiteManager support (ECS-09)
+            config_path = current_app.config['CONFIG_FILE']
             site_manager = getattr(current_app, 'site_manager', None)
             exporter = Exporter(config_path=config_path, site_manager=site_manager)
 
@@ -134,30 +250,19 @@ def export_page():
             return redirect(url_for('import_export.export_page'))
 
     # GET request: show export wizard
-    config_path = current_app.config['CONFIG_FILE']
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        pages = config.get('pages', [])
-        templates = list({p.get('template') for p in pages if p.get('template')})
-    except:
-        pages = []
-        templates = []
+    config = _load_site_config(readonly=True)
+    pages = config.get('pages', [])
+    templates = list({p.get('template') for p in pages if p.get('template')})
 
     return render_template(
         'admin/import_export/export.html',
         pages=pages,
         templates=templates,
-        export_modes=[
-            ('full', 'Full Export (All files)'),
-            ('partial', 'Partial Export (Config + Templates)'),
-            ('content', 'Content Only (Config only)')
-        ]
+        export_modes=_EXPORT_MODE_CHOICES
     )
 
 
 @import_export_bp.route('/download')
-@login_required
 def download_export():
     """Download exported file."""
     filepath = session.get('export_filepath')
@@ -172,10 +277,16 @@ def download_export():
         return redirect(url_for('import_export.export_page'))
 
     try:
-        return send_file(
-            filepath,
+        # conditional=True adds Range/If-Modified-Since support, so large
+        # exports can be resumed; the file is handed to the WSGI file_wrapper
+        export_dir, export_name = os.path.split(os.path.abspath(filepath))
+        return send_from_directory(
+            export_dir,
+            export_name,
             as_attachment=True,
-            download_name=filename
+            download_name=filename,
+            conditional=True,
+            max_age=0
         )
     except Exception as e:
         flash(f'Download error: {str(e)}', 'error')
@@ -192,7 +303,6 @@ def download_export():
 # ============================================================================
 
 @import_export_bp.route('/import', methods=['GET', 'POST'])
-@login_required
 def import_page():
     """Import wizard page."""
     if request.method == 'POST':
@@ -207,11 +317,9 @@ def import_page():
             return redirect(url_for('import_export.import_page'))
 
         try:
-            # Save uploaded file temporarily
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp:
-                file.save(tmp.name)
-                tmp_path = tmp.name
+            # A new upload replaces any import still waiting in this session
+            _discard_pending_import()
+            token, tmp_path = _save_pending_import(file)
 
             # Validate ZIP
             valid, msg = Exporter.validate_export_package(tmp_path)
@@ -220,8 +328,8 @@ def import_page():
                 os.unlink(tmp_path)
                 return redirect(url_for('import_export.import_page'))
 
-            # Store temp file path in session for next step
-            session['import_temp_file'] = tmp_path
+            # Store the token (not the path) in session for next step
+            session['import_token'] = token
             session['import_filename'] = secure_filename(file.filename)
 
             flash('File validated successfully. Review options and confirm import.', 'info')
@@ -236,28 +344,25 @@ def import_page():
 
 
 @import_export_bp.route('/import/preview')
-@login_required
 def import_preview():
     """Import preview page."""
-    tmp_file = session.get('import_temp_file')
-    if not tmp_file:
+    tmp_file = _pending_import_path(session.get('import_token'))
+    if not tmp_file or not os.path.exists(tmp_file):
         flash('No import file selected', 'error')
         return redirect(url_for('import_export.import_page'))
 
     try:
         # Load import data for preview
-        import zipfile
         with zipfile.ZipFile(tmp_file, 'r') as zf:
-            config_data = zf.read('config.json')
-            imported_config = json.loads(config_data)
-
-            manifest_data = zf.read('manifest.json')
-            manifest = json.loads(manifest_data)
+            # Parse straight from the decompressing member streams
+            with zf.open('config.json') as f:
+                imported_config = json.load(f)
+            with zf.open('manifest.json') as f:
+                manifest = json.load(f)
 
         # Load current config for comparison
         config_path = current_app.config['CONFIG_FILE']
-        with open(config_path, 'r', encoding='utf-8') as f:
-            current_config = json.load(f)
+        current_config = _load_site_config(readonly=True)
 
         # Generate preview with SiteManager support (ECS-09)
         site_manager = getattr(current_app, 'site_manager', None)
@@ -274,11 +379,7 @@ def import_preview():
             imported_config=imported_config,
             current_config=current_config,
             preview=preview,
-            conflict_strategies=[
-                ('merge', 'Merge (Keep existing pages)'),
-                ('replace', 'Replace (Overwrite all)'),
-                ('skip', 'Skip (No conflicts)'),
-            ]
+            conflict_strategies=_CONFLICT_STRATEGY_CHOICES
         )
 
     except Exception as e:
@@ -288,11 +389,10 @@ def import_preview():
 
 
 @import_export_bp.route('/import/confirm', methods=['POST'])
-@login_required
 def import_confirm():
     """Confirm and execute import."""
-    tmp_file = session.get('import_temp_file')
-    if not tmp_file:
+    tmp_file = _pending_import_path(session.get('import_token'))
+    if not tmp_file or not os.path.exists(tmp_file):
         flash('No import file available', 'error')
         return redirect(url_for('import_export.import_page'))
 
@@ -303,8 +403,7 @@ def import_confirm():
         import_images = request.form.get('import_images') == 'on'
 
         # Validate strategy
-        valid_strategies = ['merge', 'replace', 'skip']
-        if conflict_strategy not in valid_strategies:
+        if conflict_strategy not in _VALID_CONFLICT_STRATEGIES:
             flash('Invalid conflict strategy', 'error')
             return redirect(url_for('import_export.import_preview'))
 
@@ -350,10 +449,7 @@ def import_confirm():
         )
 
         # Clean up temp file
-        if os.path.exists(tmp_file):
-            os.unlink(tmp_file)
-        session.pop('import_temp_file', None)
-        session.pop('import_filename', None)
+        _discard_pending_import()
 
         if not success:
             flash(f'Import failed: {message}', 'error')
@@ -361,11 +457,7 @@ def import_confirm():
             return redirect(url_for('import_export.import_page'))
 
         # Load updated config for hook
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                updated_config = json.load(f)
-        except:
-            updated_config = {}
+        updated_config = _load_site_config()
 
         # Execute after_import hook
         try:
@@ -384,9 +476,7 @@ def import_confirm():
 
     except Exception as e:
         # Clean up
-        if os.path.exists(tmp_file):
-            os.unlink(tmp_file)
-        session.pop('import_temp_file', None)
+        _discard_pending_import()
 
         flash(f'Import error: {str(e)}', 'error')
         current_app.logger.error(f'Unexpected import error: {str(e)}')
@@ -398,7 +488,6 @@ def import_confirm():
 # ============================================================================
 
 @import_export_bp.route('/api/export-progress')
-@login_required
 def export_progress():
     """AJAX endpoint for export progress."""
     # Placeholder for real-time progress
@@ -410,7 +499,6 @@ def export_progress():
 
 
 @import_export_bp.route('/api/validate-package', methods=['POST'])
-@login_required
 def validate_package():
     """AJAX endpoint to validate package structure."""
     if 'file' not in request.files:
@@ -421,10 +509,7 @@ def validate_package():
         return jsonify({'valid': False, 'message': 'No file selected'}), 400
 
     try:
-        import tempfile
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp:
-            file.save(tmp.name)
-            tmp_path = tmp.name
+        tmp_path = _save_upload_to_temp(file)
 
         valid, msg = Exporter.validate_export_package(tmp_path)
         os.unlink(tmp_path)
@@ -2,68 +2,202 @@
 
 Provides concrete implementations of cache backends:
 - MemoryCache: In-memory caching using Python dictionaries
-- FileCache: Disk-based caching using JSON files
+- FileCache: Disk-based caching using JSON files (orjson when installed)
 - RedisCache: Redis server-based caching (optional)
 """
 
 import os
+import sys
 import json
-import pickle
 import hashlib
+import heapq
 import threading
+import time
+import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
+from typing import Any, Optional, Dict, List
+from datetime import datetime
 import logging
 
 from .manager import CacheBackend
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize a cache entry to JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson rejects (e.g. integers over 64 bits)
+            pass
+    return json.dumps(obj).encode('utf-8')
+
+
+def _file_entry_expired(entry: Dict[str, Any], now: float) -> bool:
+    """Check a FileCache entry's expiry against a time.time() value.
+
+    expires_at is stored as epoch seconds; entries written before that
+    carry an ISO 8601 string, which is still understood.
+    """
+    expires_at = entry.get('expires_at')
+    if not expires_at:
+        return False
+    if isinstance(expires_at, str):
+        expires_at = datetime.fromisoformat(expires_at).timestamp()
+    return now > expires_at
+
+
+def _loads(data) -> Any:
+    """Parse JSON bytes or text written by _dumps()."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _estimate_size(value: Any) -> int:
+    """Cheap size estimate of a cached value in bytes.
+
+    Strings and bytes count their length; other values their shallow
+    sys.getsizeof(), without walking nested containers.
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class _MemoryEntry:
+    """A MemoryCache value, its expiry deadline (time.monotonic(), or None) and size estimate."""
+
+    __slots__ = ('value', 'expires_at', 'size')
+
+    def __init__(self, value: Any, expires_at: Optional[float], size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class _MemoryStripe:
+    """One lock-protected shard of a MemoryCache."""
+
+    __slots__ = ('entries', 'lock', 'heap', 'size')
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+        # Min-heap of (expires_at, key) for entries with a TTL
+        self.heap = []
+        # Sum of the size estimates of the stored entries
+        self.size = 0
+
+    def remove(self, key: str) -> Optional[_MemoryEntry]:
+        """Remove an entry and its size; caller holds the lock."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+        return entry
+
+
 class MemoryCache(CacheBackend):
     """In-memory cache backend using Python dictionaries.
 
     Suitable for single-process deployments and caching that doesn't need
     to persist across application restarts.
 
-    Thread-safe for multi-threaded Flask servers.
+    Thread-safe for multi-threaded Flask servers. Keys are spread over
+    STRIPES dictionaries, each with its own lock, so requests touching
+    different keys do not wait on each other.
+
+    Each stripe keeps a min-heap of (expires_at, key) for entries with a TTL,
+    so expired entries are found without scanning the whole stripe. Heap
+    items for keys that were overwritten or deleted are skipped when popped.
+    Each stripe also keeps a running total of its entries' size estimates,
+    so get_stats() does not serialize every value.
     """
 
+    # Number of lock stripes (a power of two)
+    STRIPES = 16
+
+    # Stale heap items tolerated per stripe before the heap is rebuilt
+    HEAP_SLACK = 64
+
     def __init__(self):
         """Initialize in-memory cache."""
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._lock = threading.RLock()
+        self._stripes = [_MemoryStripe() for _ in range(self.STRIPES)]
         logger.debug("MemoryCache initialized")
 
+    def _stripe(self, key: str) -> _MemoryStripe:
+        """Get the stripe holding a key."""
+        return self._stripes[hash(key) & (self.STRIPES - 1)]
+
+    @staticmethod
+    def _pop_expired(stripe: _MemoryStripe, now: float) -> int:
+        """Remove a stripe's expired entries using its expiry heap.
+
+        Must be called with the stripe lock held.
+
+        Returns:
+            Number of entries removed
+        """
+        heap = stripe.heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = stripe.entries.get(key)
+            # Skip items left by keys that were since overwritten or deleted
+            if entry is not None and entry.expires_at == expires_at:
+                stripe.remove(key)
+                removed += 1
+        return removed
+
     def get(self, key: str) -> Optional[Any]:
         """Retrieve a value from memory cache."""
-        with self._lock:
-            if key not in self._cache:
+        stripe = self._stripe(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is None:
                 return None
 
-            entry = self._cache[key]
-
             # Check expiration
-            if entry['expires_at'] and datetime.now() > entry['expires_at']:
-                del self._cache[key]
+            if entry.expires_at is not None and time.monotonic() > entry.expires_at:
+                stripe.remove(key)
                 return None
 
-            return entry['value']
+            return entry.value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Store a value in memory cache."""
         try:
-            with self._lock:
-                expires_at = None
-                if ttl:
-                    expires_at = datetime.now() + timedelta(seconds=ttl)
-
-                self._cache[key] = {
-                    'value': value,
-                    'expires_at': expires_at,
-                    'created_at': datetime.now(),
-                }
+            # Expiry is a time.monotonic() deadline, unaffected by clock changes
+            now = time.monotonic()
+            expires_at = now + ttl if ttl else None
+            entry = _MemoryEntry(value, expires_at, _estimate_size(value))
+
+            stripe = self._stripe(key)
+            with stripe.lock:
+                stripe.remove(key)
+                stripe.entries[key] = entry
+                stripe.size += entry.size
+                if expires_at is not None:
+                    heapq.heappush(stripe.heap, (expires_at, key))
+
+                # Nothing calls cleanup_expired() on a schedule, so expired
+                # entries are dropped here and the heap is kept bounded
+                self._pop_expired(stripe, now)
+                if len(stripe.heap) > 2 * len(stripe.entries) + self.HEAP_SLACK:
+                    stripe.heap = [
+                        (e.expires_at, k)
+                        for k, e in stripe.entries.items()
+                        if e.expires_at is not None
+                    ]
+                    heapq.heapify(stripe.heap)
             return True
         except Exception as e:
             logger.error(f"MemoryCache set error: {str(e)}")
@@ -71,66 +205,74 @@ class MemoryCache(CacheBackend):
 
     def delete(self, key: str) -> bool:
         """Delete a value from memory cache."""
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+        stripe = self._stripe(key)
+        with stripe.lock:
+            return stripe.remove(key) is not None
 
     def clear(self) -> bool:
         """Clear all cached values."""
-        with self._lock:
-            self._cache.clear()
-            return True
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.entries.clear()
+                stripe.heap.clear()
+                stripe.size = 0
+        return True
 
     def exists(self, key: str) -> bool:
         """Check if a key exists in memory cache."""
-        with self._lock:
-            if key not in self._cache:
+        stripe = self._stripe(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is None:
                 return False
 
-            entry = self._cache[key]
-            if entry['expires_at'] and datetime.now() > entry['expires_at']:
-                del self._cache[key]
+            if entry.expires_at is not None and time.monotonic() > entry.expires_at:
+                stripe.remove(key)
                 return False
 
             return True
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get memory cache statistics."""
-        with self._lock:
-            total_size = sum(
-                len(pickle.dumps(entry['value']))
-                for entry in self._cache.values()
-            )
-            expired_count = sum(
-                1
-                for entry in self._cache.values()
-                if entry['expires_at'] and datetime.now() > entry['expires_at']
-            )
+        """Get memory cache statistics.
 
-            return {
-                'type': 'memory',
-                'total_keys': len(self._cache),
-                'estimated_size_bytes': total_size,
-                'expired_keys': expired_count,
-            }
+        estimated_size_bytes is the running total of shallow size estimates
+        (string length, or sys.getsizeof() for other values).
+        """
+        total_keys = 0
+        total_size = 0
+        expired_count = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                now = time.monotonic()
+                total_keys += len(stripe.entries)
+                total_size += stripe.size
+                expired_count += sum(
+                    1
+                    for entry in stripe.entries.values()
+                    if entry.expires_at is not None and now > entry.expires_at
+                )
+
+        return {
+            'type': 'memory',
+            'total_keys': total_keys,
+            'estimated_size_bytes': total_size,
+            'expired_keys': expired_count,
+        }
 
     def cleanup_expired(self) -> int:
         """Remove expired entries from cache.
 
+        Only heap items whose deadline has passed are visited, so the cost
+        depends on the number of expired entries, not the cache size.
+
         Returns:
             Number of entries removed
         """
-        with self._lock:
-            expired_keys = [
-                key
-                for key, entry in self._cache.items()
-                if entry['expires_at'] and datetime.now() > entry['expires_at']
-            ]
-            for key in expired_keys:
-                del self._cache[key]
-            return len(expired_keys)
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                removed += self._pop_expired(stripe, time.monotonic())
+        return removed
 
 
 class FileCache(CacheBackend):
@@ -140,9 +282,21 @@ class FileCache(CacheBackend):
     Slower than MemoryCache but provides durability.
 
     Stores each cache entry as a separate JSON file for simplicity
-    and to avoid lock contention.
+    and to avoid lock contention. Files are opened directly rather than
+    checked with exists() first, and directory scans use os.scandir(), so
+    each operation costs as few syscalls as the layout allows.
+
+    Recently read entries are kept parsed in memory together with their
+    file's stat signature, so reading an unchanged entry again costs one
+    stat() instead of an open, read and JSON parse.
     """
 
+    # Parsed entries kept in memory (least recently used evicted first)
+    HOT_ENTRIES = 1024
+
+    # Cache keys whose file path is remembered before the memo is reset
+    PATH_MEMO_SIZE = 4096
+
     def __init__(self, cache_dir: str = None):
         """Initialize file-based cache.
 
@@ -152,6 +306,11 @@ class FileCache(CacheBackend):
         self.cache_dir = Path(cache_dir or '.cache')
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._lock = threading.RLock()
+        # Cache file name -> ((mtime_ns, size, inode), parsed entry)
+        self._hot = OrderedDict()
+        self._hot_lock = threading.Lock()
+        # Cache key -> cache file path, so hot keys are hashed once
+        self._paths = {}
         logger.debug(f"FileCache initialized at {self.cache_dir}")
 
     def _get_cache_path(self, key: str) -> Path:
@@ -163,26 +322,102 @@ class FileCache(CacheBackend):
         Returns:
             Path object for cache file
         """
-        # Create safe filename from key
-        safe_key = hashlib.sha256(key.encode()).hexdigest()
-        return self.cache_dir / f"{safe_key}.json"
+        cache_path = self._paths.get(key)
+        if cache_path is None:
+            # Create safe filename from key (no security property needed,
+            # so the faster BLAKE2b is used)
+            safe_key = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+            cache_path = self.cache_dir / f"{safe_key}.json"
+            if len(self._paths) >= self.PATH_MEMO_SIZE:
+                # Bounded without LRU bookkeeping: start over when full
+                self._paths.clear()
+            self._paths[key] = cache_path
+        return cache_path
+
+    def _cache_files(self):
+        """List the cache files in one directory scan.
+
+        Returns:
+            List of os.DirEntry objects for the *.json files
+        """
+        with os.scandir(self.cache_dir) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)
+            ]
+
+    def _read_entry(self, cache_path: Path) -> Dict[str, Any]:
+        """Read a cache file, reusing the parsed entry while it is unchanged.
+
+        Args:
+            cache_path: Path of the cache file
+
+        Returns:
+            Parsed cache entry
+
+        Raises:
+            FileNotFoundError: If the cache file does not exist
+        """
+        name = cache_path.name
+        st = os.stat(cache_path)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with self._hot_lock:
+            hot = self._hot.get(name)
+            if hot is not None and hot[0] == signature:
+                self._hot.move_to_end(name)
+                return hot[1]
+
+        with open(cache_path, 'rb') as f:
+            entry = _loads(f.read())
+
+        with self._hot_lock:
+            self._hot[name] = (signature, entry)
+            self._hot.move_to_end(name)
+            if len(self._hot) > self.HOT_ENTRIES:
+                self._hot.popitem(last=False)
+        return entry
+
+    def _scan_entry(self, file: os.DirEntry) -> Dict[str, Any]:
+        """Read a cache file found by a directory scan.
+
+        The in-memory copy is reused when the file is unchanged, so scans
+        do not parse entries again just to throw them away. Entries that
+        are parsed are not kept, so a scan does not evict hot entries.
+
+        Args:
+            file: os.DirEntry of the cache file
+
+        Returns:
+            Parsed cache entry
+        """
+        st = file.stat(follow_symlinks=False)
+        with self._hot_lock:
+            hot = self._hot.get(file.name)
+        if hot is not None and hot[0] == (st.st_mtime_ns, st.st_size, st.st_ino):
+            return hot[1]
+
+        with open(file.path, 'rb') as f:
+            return _loads(f.read())
+
+    def _forget(self, name: str) -> None:
+        """Drop the in-memory copy of a cache file's entry, by file name."""
+        with self._hot_lock:
+            self._hot.pop(name, None)
 
     def get(self, key: str) -> Optional[Any]:
         """Retrieve a value from file cache."""
         try:
             cache_path = self._get_cache_path(key)
-            if not cache_path.exists():
+            try:
+                entry = self._read_entry(cache_path)
+            except FileNotFoundError:
                 return None
 
-            with open(cache_path, 'r') as f:
-                entry = json.load(f)
-
             # Check expiration
-            if entry.get('expires_at'):
-                expires_at = datetime.fromisoformat(entry['expires_at'])
-                if datetime.now() > expires_at:
-                    cache_path.unlink()  # Delete expired file
-                    return None
+            if _file_entry_expired(entry, time.time()):
+                self._forget(cache_path.name)
+                cache_path.unlink()  # Delete expired file
+                return None
 
             return entry['value']
         except Exception as e:
@@ -194,20 +429,33 @@ class FileCache(CacheBackend):
         try:
             cache_path = self._get_cache_path(key)
 
-            expires_at = None
-            if ttl:
-                expires_at = (datetime.now() + timedelta(seconds=ttl)).isoformat()
-
+            # Timestamps are epoch seconds, compared without parsing
+            now = time.time()
             entry = {
                 'key': key,
                 'value': value,
-                'expires_at': expires_at,
-                'created_at': datetime.now().isoformat(),
+                'expires_at': now + ttl if ttl else None,
+                'created_at': now,
             }
 
-            with self._lock:
-                with open(cache_path, 'w') as f:
-                    json.dump(entry, f)
+            # Encoded once and written with a single write() call to a
+            # temporary file (the buffered writer writes every byte);
+            # os.replace() then swaps it in atomically, so readers never see
+            # a partial entry and only the rename is locked
+            data = _dumps(entry)
+            temp_path = self.cache_dir / f".{cache_path.name}.{uuid.uuid4().hex}.tmp"
+            try:
+                with open(temp_path, 'xb') as f:
+                    f.write(data)
+                with self._lock:
+                    os.replace(temp_path, cache_path)
+            except BaseException:
+                try:
+                    os.unlink(temp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+            self._forget(cache_path.name)
             return True
         except Exception as e:
             logger.error(f"FileCache set error: {str(e)}")
@@ -217,10 +465,11 @@ class FileCache(CacheBackend):
         """Delete a value from file cache."""
         try:
             cache_path = self._get_cache_path(key)
-            if cache_path.exists():
-                with self._lock:
-                    cache_path.unlink()
-                return True
+            self._forget(cache_path.name)
+            with self._lock:
+                cache_path.unlink()
+            return True
+        except FileNotFoundError:
             return False
         except Exception as e:
             logger.error(f"FileCache delete error: {str(e)}")
@@ -230,8 +479,13 @@ class FileCache(CacheBackend):
         """Clear all cached values."""
         try:
             with self._lock:
-                for file in self.cache_dir.glob('*.json'):
-                    file.unlink()
+                for file in self._cache_files():
+                    try:
+                        os.unlink(file.path)
+                    except FileNotFoundError:
+                        pass
+            with self._hot_lock:
+                self._hot.clear()
             return True
         except Exception as e:
             logger.error(f"FileCache clear error: {str(e)}")
@@ -241,17 +495,15 @@ class FileCache(CacheBackend):
         """Check if a key exists in file cache."""
         try:
             cache_path = self._get_cache_path(key)
-            if not cache_path.exists():
+            try:
+                entry = self._read_entry(cache_path)
+            except FileNotFoundError:
                 return False
 
-            with open(cache_path, 'r') as f:
-                entry = json.load(f)
-
-            if entry.get('expires_at'):
-                expires_at = datetime.fromisoformat(entry['expires_at'])
-                if datetime.now() > expires_at:
-                    cache_path.unlink()
-                    return False
+            if _file_entry_expired(entry, time.time()):
+                self._forget(cache_path.name)
+                cache_path.unlink()
+                return False
 
             return True
         except Exception as e:
@@ -261,18 +513,17 @@ class FileCache(CacheBackend):
     def get_stats(self) -> Dict[str, Any]:
         """Get file cache statistics."""
         try:
-            cache_files = list(self.cache_dir.glob('*.json'))
-            total_size = sum(f.stat().st_size for f in cache_files)
+            cache_files = self._cache_files()
 
+            total_size = 0
             expired_count = 0
+            now = time.time()
             for file in cache_files:
                 try:
-                    with open(file, 'r') as f:
-                        entry = json.load(f)
-                    if entry.get('expires_at'):
-                        expires_at = datetime.fromisoformat(entry['expires_at'])
-                        if datetime.now() > expires_at:
-                            expired_count += 1
+                    entry = self._scan_entry(file)
+                    total_size += file.stat(follow_symlinks=False).st_size
+                    if _file_entry_expired(entry, now):
+                        expired_count += 1
                 except:
                     pass
 
@@ -295,16 +546,15 @@ class FileCache(CacheBackend):
         """
         removed_count = 0
         try:
-            for file in self.cache_dir.glob('*.json'):
+            now = time.time()
+            for file in self._cache_files():
                 try:
-                    with open(file, 'r') as f:
-                        entry = json.load(f)
-                    if entry.get('expires_at'):
-                        expires_at = datetime.fromisoformat(entry['expires_at'])
-                        if datetime.now() > expires_at:
-                            with self._lock:
-                                file.unlink()
-                            removed_count += 1
+                    entry = self._scan_entry(file)
+                    if _file_entry_expired(entry, now):
+                        self._forget(file.name)
+                        with self._lock:
+                            os.unlink(file.path)
+                        removed_count += 1
                 except:
                     pass
         except Exception as e:
@@ -344,7 +594,9 @@ class RedisCache(CacheBackend):
                 port=port,
                 db=db,
                 password=password,
-                decode_responses=True,
+                # Values are JSON bytes parsed directly by _loads(); decoding
+                # them to str first would only add a copy
+                decode_responses=False,
             )
             # Test connection
             self.redis.ping()
@@ -375,7 +627,7 @@ class RedisCache(CacheBackend):
             value = self.redis.get(key)
             if value is None:
                 return None
-            return json.loads(value)
+            return _loads(value)
         except Exception as e:
             logger.error(f"RedisCache get error: {str(e)}")
             return None
@@ -386,12 +638,42 @@ class RedisCache(CacheBackend):
             return False
 
         try:
-            self.redis.set(key, json.dumps(value), ex=ttl)
+            # SET with EX stores the value and its TTL in one command
+            self.redis.set(key, _dumps(value), ex=ttl)
             return True
         except Exception as e:
             logger.error(f"RedisCache set error: {str(e)}")
             return False
 
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve several values with a single MGET round-trip."""
+        if not keys or not self._check_available():
+            return [None] * len(keys)
+
+        try:
+            return [
+                _loads(value) if value is not None else None
+                for value in self.redis.mget(keys)
+            ]
+        except Exception as e:
+            logger.error(f"RedisCache get_many error: {str(e)}")
+            return [None] * len(keys)
+
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Store several values in one pipelined round-trip."""
+        if not self._check_available():
+            return False
+
+        try:
+            # No MULTI/EXEC: the commands only need to share a round-trip
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.set(key, _dumps(value), ex=ttl)
+            return all(pipe.execute())
+        except Exception as e:
+            logger.error(f"RedisCache set_many error: {str(e)}")
+            return False
+
     def delete(self, key: str) -> bool:
         """Delete a value from Redis cache."""
         if not self._check_available():
@@ -6,6 +6,7 @@ reducing JSON parsing overhead.
 
 import os
 import json
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 import logging
@@ -23,6 +24,9 @@ class CachedConfigManager:
 
     Features:
     - Automatic file change detection via mtime
+    - Last loaded config kept on the instance, so a steady-state load()
+      is one stat() without a cache backend call; any delete or clear on
+      the cache manager (e.g. the admin "clear cache" action) drops it
     - Configurable cache TTL
     - Manual cache invalidation
     - Cache statistics tracking
@@ -44,9 +48,14 @@ class CachedConfigManager:
         self.cache_manager = cache_manager
         self.config_path = Path(config_path)
         self.cache_ttl = cache_ttl
-        self._file_mtime: Optional[float] = None
+        self._file_mtime: Optional[int] = None
         self._cache_key = 'config:main'
         self._load_method = None
+        # Last loaded config, its time.monotonic() expiry (cache_ttl) and
+        # the cache manager generation it was read under
+        self._cached_config: Optional[Dict[str, Any]] = None
+        self._cached_until = 0.0
+        self._cached_generation = -1
 
         logger.debug(f"CachedConfigManager initialized for {config_path}")
 
@@ -58,11 +67,14 @@ class CachedConfigManager:
         """
         self._load_method = load_func
 
-    def _get_file_mtime(self) -> Optional[float]:
-        """Get config file modification time."""
+    def _get_file_mtime(self) -> Optional[int]:
+        """Get config file modification time in nanoseconds.
+
+        One stat() call; an integer compares exactly, unlike float seconds.
+        """
         try:
-            if self.config_path.exists():
-                return self.config_path.stat().st_mtime
+            return os.stat(self.config_path).st_mtime_ns
+        except FileNotFoundError:
             return None
         except Exception as e:
             logger.warning(f"Could not get file mtime: {str(e)}")
@@ -102,12 +114,19 @@ class CachedConfigManager:
         # Check if file has changed
         if self._file_changed():
             logger.debug("Cache invalidated due to file change")
+            self._cached_config = None
             self.cache_manager.delete(self._cache_key)
+        elif (self._cached_config is not None
+              and self._cached_generation == self.cache_manager.generation
+              and time.monotonic() < self._cached_until):
+            self.cache_manager.record_hit(self._cache_key)
+            return self._cached_config
 
         # Try to get from cache
         cached_config = self.cache_manager.get(self._cache_key)
         if cached_config is not None:
             logger.debug("Config loaded from cache")
+            self._remember(cached_config)
             return cached_config
 
         # Load from disk
@@ -120,14 +139,24 @@ class CachedConfigManager:
 
         if config is not None:
             self.cache_manager.set(self._cache_key, config, self.cache_ttl)
+            self._remember(config)
 
         return config
 
+    def _remember(self, config: Dict[str, Any]) -> None:
+        """Keep a loaded config on the instance for up to cache_ttl seconds."""
+        self._cached_config = config
+        self._cached_generation = self.cache_manager.generation
+        self._cached_until = (
+            time.monotonic() + self.cache_ttl if self.cache_ttl else float('inf')
+        )
+
     def invalidate(self) -> None:
         """Manually invalidate config cache.
 
         Call this after updating config programmatically.
         """
+        self._cached_config = None
         self.cache_manager.delete(self._cache_key)
         self._file_mtime = self._get_file_mtime()
         logger.info("Config cache manually invalidated")
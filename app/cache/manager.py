@@ -48,6 +48,21 @@ class CacheBackend(ABC):
         """Get cache statistics."""
         pass
 
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve several values, in key order (None for misses).
+
+        Backends with a batch command override this to save round-trips.
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Store several values with the same TTL.
+
+        Backends with a batch command override this to save round-trips.
+        """
+        results = [self.set(key, value, ttl) for key, value in mapping.items()]
+        return all(results)
+
 
 class CacheManager:
     """Main cache manager with abstraction for multiple backends.
@@ -76,6 +91,9 @@ class CacheManager:
             'errors': 0,
         }
         self._created_at = datetime.now()
+        # Bumped by every delete() and clear(), so callers holding a local
+        # copy of a cached value can tell it may have been invalidated
+        self.generation = 0
         logger.info(f"CacheManager initialized with {backend.__class__.__name__}")
 
     def get(self, key: str) -> Optional[Any]:
@@ -124,6 +142,48 @@ class CacheManager:
             logger.error(f"Cache set error for key '{key}': {str(e)}")
             return False
 
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve several values from cache in one backend call.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            List of cached values in key order, None for misses
+        """
+        try:
+            values = self.backend.get_many(keys)
+            hits = sum(1 for value in values if value is not None)
+            self.stats['hits'] += hits
+            self.stats['misses'] += len(values) - hits
+            logger.debug(f"Cache get_many: {hits}/{len(values)} hits")
+            return values
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Cache get_many error: {str(e)}")
+            return [None] * len(keys)
+
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Store several values in cache in one backend call.
+
+        Args:
+            mapping: Cache keys and the values to store under them
+            ttl: Time to live in seconds (None = no expiration)
+
+        Returns:
+            True if every value was stored, False otherwise
+        """
+        try:
+            result = self.backend.set_many(mapping, ttl)
+            if result:
+                self.stats['sets'] += len(mapping)
+                logger.debug(f"Cache set_many: {len(mapping)} keys")
+            return result
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Cache set_many error: {str(e)}")
+            return False
+
     def delete(self, key: str) -> bool:
         """Delete a value from cache.
 
@@ -133,6 +193,7 @@ class CacheManager:
         Returns:
             True if successful, False otherwise
         """
+        self.generation += 1
         try:
             result = self.backend.delete(key)
             if result:
@@ -150,6 +211,7 @@ class CacheManager:
         Returns:
             True if successful, False otherwise
         """
+        self.generation += 1
         try:
             result = self.backend.clear()
             if result:
@@ -161,6 +223,15 @@ class CacheManager:
             logger.error(f"Cache clear error: {str(e)}")
             return False
 
+    def record_hit(self, key: str) -> None:
+        """Count a hit served from a caller's local copy of a cached value.
+
+        Args:
+            key: Cache key of the value
+        """
+        self.stats['hits'] += 1
+        logger.debug(f"Cache hit (local copy): {key}")
+
     def exists(self, key: str) -> bool:
         """Check if a key exists in cache.
 
@@ -51,6 +51,9 @@ class ResponseCache:
         self.default_ttl = default_ttl
         self.max_age = max_age
         self.enable_compression = enable_compression
+        # Encoded bodies per URL, kept in-process as (etag, body, gzipped body)
+        # so cache hits skip str -> bytes encoding and recompression
+        self._encoded: Dict[str, Tuple[str, bytes, Optional[bytes]]] = {}
 
         logger.debug("ResponseCache initialized")
 
@@ -79,6 +82,29 @@ class ResponseCache:
         """
         return len(content) > 1024  # Compress if > 1KB
 
+    def _get_encoded(self, url: str, content: str, etag: str) -> Tuple[bytes, Optional[bytes]]:
+        """Get the UTF-8 body and its gzip variant for a cached response.
+
+        Args:
+            url: Request URL
+            content: Response content
+            etag: ETag of content
+
+        Returns:
+            Tuple of (body, gzipped body or None)
+        """
+        encoded = self._encoded.get(url)
+        if encoded is not None and encoded[0] == etag:
+            return encoded[1], encoded[2]
+
+        body = content.encode('utf-8')
+        gzipped = None
+        if self.enable_compression and self._should_compress(content):
+            gzipped = gzip.compress(body, compresslevel=6)
+
+        self._encoded[url] = (etag, body, gzipped)
+        return body, gzipped
+
     def cache_response(
         self,
         url: str,
@@ -86,15 +112,21 @@ class ResponseCache:
         ttl: Optional[int] = None,
         public: bool = True,
         must_revalidate: bool = False,
+        accept_gzip: bool = False,
     ):
         """Cache an HTTP response.
 
+        The encoded (and, for large bodies, gzipped) body is kept in-process,
+        so repeated hits send precomputed bytes.
+
         Args:
             url: Request URL
             render_func: Callable that produces response
             ttl: Cache TTL in seconds
             public: Whether response is publicly cacheable
             must_revalidate: Whether response must be revalidated
+            accept_gzip: Whether the client accepts gzip with a non-zero
+                         quality (e.g. request.accept_encodings['gzip'] > 0)
 
         Returns:
             Flask Response object with proper cache headers
@@ -131,7 +163,14 @@ class ResponseCache:
             logger.error('Flask Response class not available')
             return None
 
-        response = Response(content, content_type='text/html; charset=utf-8')
+        body, gzipped = self._get_encoded(url, content, etag)
+        if gzipped is not None and accept_gzip:
+            response = Response(gzipped, content_type='text/html; charset=utf-8')
+            response.headers['Content-Encoding'] = 'gzip'
+            # Compressed representation gets its own ETag
+            etag = f'{etag}-gzip'
+        else:
+            response = Response(body, content_type='text/html; charset=utf-8')
 
         # Set cache headers
         cache_control = self._build_cache_control(public, must_revalidate)
@@ -209,10 +248,10 @@ class ResponseCache:
         if if_none_match:
             # Remove quotes from If-None-Match
             if_none_match = if_none_match.strip('"')
-            if if_none_match == etag:
+            if if_none_match in (etag, f'{etag}-gzip'):
                 logger.debug(f"304 Not Modified (ETag): {url}")
                 response = Response(status=304)
-                response.headers['ETag'] = f'"{etag}"'
+                response.headers['ETag'] = f'"{if_none_match}"'
                 response.headers['Cache-Control'] = self._build_cache_control()
                 return response
 
@@ -244,6 +283,7 @@ class ResponseCache:
             True if something was invalidated
         """
         cache_key = f"response:{url}"
+        self._encoded.pop(url, None)
         success = self.cache_manager.delete(cache_key)
         if success:
             logger.info(f"Invalidated response: {url}")
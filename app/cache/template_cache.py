@@ -5,6 +5,7 @@ and selective cache warming.
 """
 
 import hashlib
+import json
 from typing import Optional, Dict, Any, Callable, List
 import logging
 
@@ -53,7 +54,6 @@ class TemplateCacheKey:
             Hex digest hash of context
         """
         # Create stable JSON representation for hashing
-        import json
         try:
             context_str = json.dumps(context, sort_keys=True, default=str)
             return hashlib.sha256(context_str.encode()).hexdigest()
@@ -25,10 +25,26 @@ class Config:
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
 
+    # Login throttling (per client IP, 0 disables)
+    LOGIN_ATTEMPTS_PER_MINUTE = int(os.environ.get('LOGIN_ATTEMPTS_PER_MINUTE', '10'))
+    # Minimum duration of a password check in seconds, so response time does
+    # not reveal which check rejected the password (0 disables)
+    LOGIN_MIN_SECONDS = float(os.environ.get('LOGIN_MIN_SECONDS', '0.25'))
+
     # File Upload
     MAX_CONTENT_LENGTH = 5 * 1024 * 1024  # 5MB
     UPLOAD_FOLDER = os.path.join('static', 'images', 'uploads')
     ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+    # Uploaded files are content-addressed, so browsers may cache them for a year
+    UPLOAD_MAX_AGE = 31536000
+    # Per-site static files keep their names when edited; cache briefly, then
+    # revalidate (conditional requests answer 304 when unchanged)
+    SITE_STATIC_MAX_AGE = int(os.environ.get('SITE_STATIC_MAX_AGE', '3600'))
+
+    # JSON responses: keep insertion order and skip pretty-printing (also
+    # applied to the app.json provider, which newer Flask versions use)
+    JSON_SORT_KEYS = False
+    JSONIFY_PRETTYPRINT_REGULAR = False
 
     # Configuration File
     CONFIG_FILE = 'config.json'
@@ -36,6 +52,9 @@ class Config:
     # Import/Export
     EXPORT_DIR = os.environ.get('EXPORT_DIR', 'exports')
 
+    # Compiled Jinja2 templates shared across workers and restarts (empty disables)
+    JINJA_CACHE_DIR = os.environ.get('JINJA_CACHE_DIR', os.path.join('.cache', 'jinja'))
+
     # Logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
     LOG_FILE = os.environ.get('LOG_FILE', 'logs/wicara.log')
@@ -81,6 +100,7 @@ class TestingConfig(Config):
     SESSION_COOKIE_SECURE = False
     SECRET_KEY = 'test-secret-key'
     CONFIG_FILE = 'config.test.json'
+    LOGIN_MIN_SECONDS = 0
 
 
 def get_config():
@@ -4,7 +4,7 @@ Central module containing core functionality for the CMS.
 """
 
 # Configuration Manager
-from app.core.config_manager import ConfigManager, load_config, save_config
+from app.core.config_manager import ConfigManager, load_config, save_config, get_page_index
 
 # Template Manager
 from app.core.template_manager import (
@@ -20,6 +20,7 @@ from app.core.file_manager import (
     save_upload_file,
     delete_file,
     delete_image,
+    atomic_write,
     create_backup,
     cleanup_unused_images,
     ensure_directories
@@ -29,6 +30,7 @@ from app.core.file_manager import (
 from app.core.validators import (
     validate_field_value,
     validate_image_file,
+    password_character_classes,
     validate_config_schema,
     validate_page_schema,
     validate_field_schema
@@ -39,6 +41,7 @@ __all__ = [
     'ConfigManager',
     'load_config',
     'save_config',
+    'get_page_index',
     # Template Manager
     'convert_keys_to_underscore',
     'prepare_template_context',
@@ -49,12 +52,14 @@ __all__ = [
     'save_upload_file',
     'delete_file',
     'delete_image',
+    'atomic_write',
     'create_backup',
     'cleanup_unused_images',
     'ensure_directories',
     # Validators
     'validate_field_value',
     'validate_image_file',
+    'password_character_classes',
     'validate_config_schema',
     'validate_page_schema',
     'validate_field_schema',
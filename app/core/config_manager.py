@@ -3,11 +3,126 @@ WICARA Core Module: Configuration Manager
 Handles loading, saving, and validation of application configuration.
 """
 
+import hashlib
 import json
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from app.core.validators import validate_config_schema
-from app.core.file_manager import create_backup
+from app.core.file_manager import atomic_write, create_backup
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+    JSONEncodeError = orjson.JSONEncodeError
+
+    def _json_loads(data):
+        """Parse config bytes with orjson."""
+        return orjson.loads(data)
+
+    def _json_dumps(config):
+        """Serialize config to UTF-8 bytes with orjson (2-space indent)."""
+        return orjson.dumps(
+            config,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+else:
+    JSONDecodeError = json.JSONDecodeError
+    JSONEncodeError = (TypeError, ValueError)
+
+    def _json_loads(data):
+        """Parse config bytes with the stdlib json module."""
+        return json.loads(data)
+
+    def _json_dumps(config):
+        """Serialize config to UTF-8 bytes with the stdlib json module."""
+        return (json.dumps(config, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+# Parsed configurations shared by every ConfigManager instance, keyed by absolute
+# config path. Each entry holds the file's stat signature (mtime_ns, size, inode),
+# the raw bytes and the parsed dict, and is reused until the signature changes.
+_CONFIG_CACHE = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Validation results keyed by a BLAKE2b digest of the serialized config, so a
+# config whose content was already checked (on load or on a previous save)
+# is not walked again. Bounded LRU.
+_VALIDATION_CACHE = OrderedDict()
+_VALIDATION_CACHE_MAX = 32
+
+# Validation stops walking pages and fields after this many errors; only the
+# first few are reported anyway
+_VALIDATION_ERROR_LIMIT = 3
+
+# URL -> page index of the last config passed to get_page_index(), stored as a
+# (source, index) pair and rebuilt only when a different config object arrives.
+_page_index = None
+
+
+def get_page_index(config):
+    """
+    Get a URL -> page dictionary for a configuration.
+
+    The index is rebuilt only when called with a different config object, so
+    lookups against the cached configuration are O(1) dict hits.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Dictionary mapping page URL to page configuration
+    """
+    global _page_index
+
+    cached = _page_index
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    index = {}
+    for page in config.get('pages', []):
+        # First page wins on duplicate URLs, matching the old linear scan
+        index.setdefault(page.get('url'), page)
+
+    _page_index = (config, index)
+    return index
+
+
+def _validate_serialized(data, config):
+    """
+    Validate a configuration, reusing the result for identical content.
+
+    Args:
+        data: Serialized configuration bytes (from disk or _json_dumps)
+        config: The same configuration as a dictionary
+
+    Returns:
+        List of validation error messages
+    """
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    with _CONFIG_CACHE_LOCK:
+        errors = _VALIDATION_CACHE.get(key)
+        if errors is not None:
+            _VALIDATION_CACHE.move_to_end(key)
+            return errors
+
+    errors = validate_config_schema(config, error_limit=_VALIDATION_ERROR_LIMIT)
+    with _CONFIG_CACHE_LOCK:
+        _VALIDATION_CACHE[key] = errors
+        while len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAX:
+            _VALIDATION_CACHE.popitem(last=False)
+    return errors
+
+
+def _stat_signature(st):
+    """Identify a config file version by mtime, size and inode."""
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
 
 
 class ConfigManager:
@@ -39,15 +154,68 @@ class ConfigManager:
         self.logger = logger
         self._config = None
 
-    def load(self, validate=True):
+    def _cache_entry(self):
+        """
+        Get the process-wide cache entry for this config file.
+
+        The file is only re-read and re-parsed when its stat signature differs
+        from the cached entry, so repeated loads cost a single stat() call.
+
+        Returns:
+            Cache entry dictionary ('signature', 'raw', 'data' and, once
+            validated, 'errors')
+
+        Raises:
+            FileNotFoundError, PermissionError, JSONDecodeError: Propagated to load()
+        """
+        path = os.path.abspath(self.config_file)
+        signature = _stat_signature(os.stat(path))
+
+        entry = _CONFIG_CACHE.get(path)
+        if entry is None or entry['signature'] != signature:
+            with _CONFIG_CACHE_LOCK:
+                entry = _CONFIG_CACHE.get(path)
+                if entry is None or entry['signature'] != signature:
+                    with open(path, 'rb') as f:
+                        raw = f.read()
+                    entry = {'signature': signature, 'raw': raw, 'data': _json_loads(raw)}
+                    _CONFIG_CACHE[path] = entry
+                    if self.logger:
+                        self.logger.debug(f'Config parsed from disk: {path}')
+
+        return entry
+
+    def _is_current(self, entry):
+        """
+        Check that a cache entry still matches the config file on disk.
+
+        Args:
+            entry: Cache entry dictionary
+
+        Returns:
+            True if the file's stat signature matches the entry
+        """
+        try:
+            return entry['signature'] == _stat_signature(os.stat(self.config_file))
+        except OSError:
+            return False
+
+    def load(self, validate=True, readonly=False):
         """
         Load configuration from JSON file.
 
         Attempts to load config.json and optionally validates it against schema.
         If file doesn't exist, creates default configuration.
 
+        Parsed configuration and its validation result are cached per file and
+        reused until config.json changes on disk.
+
         Args:
             validate: Whether to validate configuration schema
+            readonly: Return the shared cached dictionary. Callers passing True
+                      must not mutate the result; editors should use the default.
+                      When after_config_load handlers are registered they get,
+                      and the caller receives, a private copy instead.
 
         Returns:
             Configuration dictionary or None if error
@@ -63,12 +231,17 @@ class ConfigManager:
                 if self.logger:
                     self.logger.debug(f'Plugin hook before_config_load error: {e}')
 
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            entry = self._cache_entry()
+            # Callers that edit the config get their own copy, parsed from the
+            # cached bytes so no disk I/O is needed.
+            config = entry['data'] if readonly else _json_loads(entry['raw'])
 
-            # Validate configuration schema if requested
+            # Validate configuration schema if requested. The result is kept
+            # on the cache entry, so each version of the file is validated once.
             if validate:
-                errors = validate_config_schema(config)
+                errors = entry.get('errors')
+                if errors is None:
+                    errors = entry['errors'] = _validate_serialized(entry['raw'], entry['data'])
                 if errors:
                     error_msg = 'Configuration validation failed: ' + '; '.join(errors[:3])
                     if self.logger:
@@ -79,7 +252,11 @@ class ConfigManager:
             try:
                 from app.plugins import get_plugin_manager
                 manager = get_plugin_manager()
-                if manager:
+                if manager and manager.hooks.get_handlers('after_config_load'):
+                    if config is entry['data']:
+                        # Handlers may edit the config in place; never hand
+                        # them the dictionary shared by every reader
+                        config = _json_loads(entry['raw'])
                     result = manager.hooks.execute('after_config_load', config)
                     # If hook returns modified config, use it
                     if result is not None and isinstance(result, dict):
@@ -96,7 +273,7 @@ class ConfigManager:
                 self.logger.warning(f'Config file not found: {self.config_file}, creating default')
             return self.create_default()
 
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             if self.logger:
                 self.logger.error(f'JSON decode error: {e}')
             return None
@@ -116,7 +293,8 @@ class ConfigManager:
         Save configuration to JSON file with automatic backup.
 
         Creates a backup of the existing config file before saving new configuration.
-        Optionally validates configuration before saving.
+        Optionally validates configuration before saving. Saving content that
+        is identical to the current file skips the backup and the write.
 
         Args:
             config: Configuration dictionary to save
@@ -126,9 +304,11 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
+            data = _json_dumps(config)
+
             # Validate configuration schema before saving
             if validate:
-                errors = validate_config_schema(config)
+                errors = _validate_serialized(data, config)
                 if errors:
                     error_msg = 'Configuration validation failed: ' + '; '.join(errors[:3])
                     if self.logger:
@@ -136,10 +316,12 @@ class ConfigManager:
                     return False
 
             # Execute before_config_save hook
+            hooked = False
             try:
                 from app.plugins import get_plugin_manager
                 manager = get_plugin_manager()
                 if manager:
+                    hooked = True
                     result = manager.hooks.execute('before_config_save', config)
                     # If hook returns modified config, use it
                     if result is not None and isinstance(result, dict):
@@ -148,12 +330,32 @@ class ConfigManager:
                 if self.logger:
                     self.logger.debug(f'Plugin hook before_config_save error: {e}')
 
-            # Create backup before saving
-            create_backup(self.config_file)
-
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            if hooked:
+                # Hooks may have replaced or edited the config
+                data = _json_dumps(config)
 
+            path = os.path.abspath(self.config_file)
+            entry = _CONFIG_CACHE.get(path)
+            if entry is not None and entry['raw'] == data and self._is_current(entry):
+                if self.logger:
+                    self.logger.debug('Config unchanged, skipping write')
+            else:
+                # Create backup before saving. The file is replaced rather
+                # than rewritten, so the backup can share the old inode.
+                create_backup(self.config_file, link=True)
+
+                # Written via a temp file + rename so concurrent loads never
+                # read a half-written config.json
+                written = atomic_write(self.config_file, data)
+
+                # Seed the cache with what was just written so the next load is a
+                # stat() hit instead of a re-read
+                with _CONFIG_CACHE_LOCK:
+                    _CONFIG_CACHE[path] = {
+                        'signature': _stat_signature(written),
+                        'raw': data,
+                        'data': _json_loads(data)
+                    }
             self._config = config
 
             # Execute after_config_save hook
@@ -173,7 +375,7 @@ class ConfigManager:
                 self.logger.error('Permission denied saving config file')
             return False
 
-        except json.JSONEncodeError as e:
+        except JSONEncodeError as e:
             if self.logger:
                 self.logger.error(f'JSON encode error: {e}')
             return False
@@ -244,7 +446,7 @@ class ConfigManager:
             Configuration value or default
         """
         if self._config is None:
-            self.load(validate=False)
+            self.load(validate=False, readonly=True)
 
         value = self._config
         for key in keys:
@@ -268,16 +470,12 @@ class ConfigManager:
             Page configuration dictionary or None
         """
         if self._config is None:
-            self.load(validate=False)
+            self.load(validate=False, readonly=True)
 
         if self._config is None:
             return None
 
-        for page in self._config.get('pages', []):
-            if page.get('url') == url:
-                return page
-
-        return None
+        return get_page_index(self._config).get(url)
 
     @property
     def config(self):
@@ -290,7 +488,8 @@ class ConfigManager:
         return self._config is not None
 
 
-def load_config(config_file='config.json', validate=True, logger=None, site_manager=None):
+def load_config(config_file='config.json', validate=True, logger=None, site_manager=None,
+                readonly=False):
     """
     Load configuration from JSON file (functional interface).
 
@@ -302,12 +501,13 @@ def load_config(config_file='config.json', validate=True, logger=None, site_mana
         validate: Whether to validate configuration schema
         logger: Logger instance for logging
         site_manager: SiteManager instance for ECS (takes precedence over config_file)
+        readonly: Return the shared cached dictionary (must not be mutated)
 
     Returns:
         Configuration dictionary or None if error
     """
     manager = ConfigManager(config_file, logger, site_manager)
-    return manager.load(validate=validate)
+    return manager.load(validate=validate, readonly=readonly)
 
 
 def save_config(config, config_file='config.json', validate=True, logger=None, site_manager=None):
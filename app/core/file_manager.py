@@ -3,11 +3,40 @@ WICARA Core Module: File Manager
 Handles file operations, uploads, and image cleanup.
 """
 
+import errno
+import hashlib
 import os
+import re
 import shutil
 import uuid
 
 
+# Read size used when streaming uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Characters stripped from uploaded filenames
+_DANGEROUS_FILENAME_RE = re.compile(r'[/\\:*?"<>|]+')
+
+# Absolute paths of directories already created or found by _ensure_dir()
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path):
+    """
+    Create a directory (and parents) once per process.
+
+    Later calls for the same path return without a mkdir syscall.
+
+    Args:
+        path: Directory path
+    """
+    path = os.path.abspath(path)
+    if path in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
 def sanitize_filename(filename):
     """
     Sanitize filename to prevent path traversal attacks.
@@ -21,10 +50,8 @@ def sanitize_filename(filename):
     # Remove directory separators
     filename = os.path.basename(filename)
 
-    # Remove dangerous characters
-    dangerous_chars = ['..', '/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    for char in dangerous_chars:
-        filename = filename.replace(char, '')
+    # Remove dangerous characters in one pass, then any '..' left behind
+    filename = _DANGEROUS_FILENAME_RE.sub('', filename).replace('..', '')
 
     # Ensure filename is not empty
     if not filename or filename.startswith('.'):
@@ -35,13 +62,17 @@ def sanitize_filename(filename):
 
 def save_upload_file(file, upload_folder=None, site_manager=None, site_id=None):
     """
-    Save uploaded file to upload folder with unique name.
+    Save uploaded file to upload folder with a content-addressed name.
+
+    The upload is streamed to disk in UPLOAD_CHUNK_SIZE chunks while being
+    hashed with BLAKE2b, and stored as "<digest>_<filename>". Re-uploading an
+    identical file reuses the existing copy instead of writing a duplicate.
 
     Supports both legacy mode (upload_folder parameter) and sites mode (site_manager).
     If site_manager is provided, it takes precedence over upload_folder parameter.
 
     Args:
-        file: File object to save
+        file: Uploaded file object (werkzeug FileStorage)
         upload_folder: Target upload folder path (legacy mode, optional)
         site_manager: SiteManager instance for ECS (takes precedence, optional)
         site_id: Site identifier for multi-site support (optional, uses default if None)
@@ -59,13 +90,43 @@ def save_upload_file(file, upload_folder=None, site_manager=None, site_id=None):
         raise ValueError("Either upload_folder or site_manager must be provided")
 
     safe_filename = sanitize_filename(file.filename)
-    unique_filename = f"{uuid.uuid4().hex}_{safe_filename}"
-    file_path = os.path.join(upload_folder, unique_filename)
 
     # Ensure upload directory exists
-    os.makedirs(upload_folder, exist_ok=True)
+    _ensure_dir(upload_folder)
+
+    # Validation reads the header through the same stream; start from byte 0
+    try:
+        file.stream.seek(0)
+    except (AttributeError, OSError):
+        pass
+
+    # Write to a temporary file in the same directory so the final rename is atomic
+    temp_path = os.path.join(upload_folder, f'.upload_{uuid.uuid4().hex}')
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(temp_path, 'xb') as f:
+            while True:
+                chunk = file.stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                f.write(chunk)
+
+        unique_filename = f"{digest.hexdigest()}_{safe_filename}"
+        file_path = os.path.join(upload_folder, unique_filename)
+
+        if os.path.exists(file_path):
+            # Identical upload already stored
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
-    file.save(file_path)
     return file_path, unique_filename
 
 
@@ -80,12 +141,10 @@ def delete_file(file_path):
         True if successful, False otherwise
     """
     try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            return True
+        os.remove(file_path)
+        return True
     except Exception:
         return False
-    return False
 
 
 def delete_image(image_path):
@@ -104,12 +163,81 @@ def delete_image(image_path):
     return False
 
 
-def create_backup(config_file):
+def atomic_write(file_path, data):
+    """
+    Write bytes to a file so readers never see it partially written.
+
+    Data goes to a temporary file in the same directory, which is flushed to
+    disk with os.fsync() and then replaces the target with os.replace(), so a
+    crash leaves either the old or the new content. Only if the target
+    itself cannot be replaced (EBUSY or EXDEV, for example a config.json
+    bind-mounted into a container) is it written in place; any other error,
+    such as a full disk while writing the temporary file, is raised with the
+    target untouched.
+
+    Args:
+        file_path: Path to file to write
+        data: Bytes to write
+
+    Returns:
+        os.stat_result of the written file
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    temp_path = os.path.join(
+        directory, f'.{os.path.basename(file_path)}.{uuid.uuid4().hex}.tmp'
+    )
+
+    try:
+        with open(temp_path, 'xb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            # Renaming keeps inode, size and mtime, so this describes the target
+            written = os.fstat(f.fileno())
+        try:
+            # Keep the permissions of the file being replaced
+            shutil.copymode(file_path, temp_path)
+        except FileNotFoundError:
+            pass
+    except BaseException:
+        # The target is untouched; never fall back to writing it in place
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    try:
+        os.replace(temp_path, file_path)
+        return written
+    except OSError as e:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        # Only a target that cannot be renamed over is written in place
+        if e.errno not in (errno.EBUSY, errno.EXDEV):
+            raise
+
+    with open(file_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+        return os.fstat(f.fileno())
+
+
+def create_backup(config_file, link=False):
     """
     Create backup of configuration file.
 
     Args:
         config_file: Path to config file
+        link: Hard-link the backup to the current file instead of copying it.
+              Only safe when the caller then replaces config_file with
+              atomic_write(), which leaves the linked inode untouched.
 
     Returns:
         Path to backup file or None
@@ -117,6 +245,18 @@ def create_backup(config_file):
     try:
         if os.path.exists(config_file):
             backup_file = config_file + '.backup'
+            if link:
+                temp_path = f'{backup_file}.{uuid.uuid4().hex}.tmp'
+                try:
+                    os.link(config_file, temp_path)
+                    os.replace(temp_path, backup_file)
+                    return backup_file
+                except OSError:
+                    # Cross-device (e.g. bind-mounted file) or no link support
+                    try:
+                        os.remove(temp_path)
+                    except FileNotFoundError:
+                        pass
             shutil.copy2(config_file, backup_file)
             return backup_file
     except Exception:
@@ -146,20 +286,9 @@ def cleanup_unused_images(config, logger=None, site_manager=None, site_id=None,
         # ECS-05: Support site_manager for multi-site cleanup
         if site_manager is not None:
             upload_dir = site_manager.get_uploads_dir(site_id)
-            # In sites mode, paths should be relative to site root
-            path_prefix = '/sites/'
-            if site_id is None:
-                site_id = site_manager.default_site
         elif upload_dir is None:
             # Legacy mode with default path
             upload_dir = os.path.join('static', 'images', 'uploads')
-            path_prefix = '/static/images/uploads/'
-        else:
-            # Custom upload_dir provided (for testing)
-            path_prefix = '/static/images/uploads/'
-
-        # Get all referenced image paths
-        referenced_images = set()
 
         # Check page fields and extract filenames (not full paths)
         referenced_filenames = set()
@@ -169,29 +298,27 @@ def cleanup_unused_images(config, logger=None, site_manager=None, site_id=None,
                 if field.get('type') == 'image' and field.get('value'):
                     value = field['value']
 
-                    # Extract just the filename from various path formats
-                    if value.startswith(f'/sites/') and '/static/images/uploads/' in value:
-                        # Sites mode path: /sites/{site_id}/static/images/uploads/filename
-                        filename = value.split('/static/images/uploads/')[-1]
-                        referenced_filenames.add(filename)
-                    elif value.startswith('/static/images/uploads/'):
-                        # Legacy mode path: /static/images/uploads/filename
-                        filename = value.split('/static/images/uploads/')[-1]
-                        referenced_filenames.add(filename)
-
-        # Get all uploaded images
-        if not os.path.exists(upload_dir):
+                    # Sites mode (/sites/{site_id}/static/images/uploads/filename)
+                    # and legacy mode (/static/images/uploads/filename) paths
+                    if value.startswith(('/sites/', '/static/images/uploads/')):
+                        _, marker, filename = value.rpartition('/static/images/uploads/')
+                        if marker:
+                            referenced_filenames.add(filename)
+
+        # Compare filenames, not full paths. scandir() reports the entry type
+        # from the directory listing, so no stat() is needed per file.
+        try:
+            with os.scandir(upload_dir) as entries:
+                uploaded_files = [
+                    (entry.name, entry.path)
+                    for entry in entries
+                    if entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
             if logger:
                 logger.debug(f'Upload directory does not exist: {upload_dir}')
             return True
 
-        # Compare filenames, not full paths
-        uploaded_files = []
-        for filename in os.listdir(upload_dir):
-            file_path = os.path.join(upload_dir, filename)
-            if os.path.isfile(file_path):
-                uploaded_files.append((filename, file_path))
-
         # Remove unused images by comparing filenames
         removed_count = 0
 
@@ -208,6 +335,9 @@ def cleanup_unused_images(config, logger=None, site_manager=None, site_id=None,
                     removed_count += 1
                     if logger:
                         logger.info(f'Removed unused image: {file_path}')
+                except FileNotFoundError:
+                    # Already gone (removed concurrently)
+                    pass
                 except Exception as e:
                     if logger:
                         logger.error(f'Failed to remove {file_path}: {e}')
@@ -230,9 +360,9 @@ def ensure_directories(app):
         app: Flask application instance
     """
     # Create upload directory
-    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    _ensure_dir(app.config['UPLOAD_FOLDER'])
 
     # Create logs directory
     log_dir = os.path.dirname(app.config['LOG_FILE'])
     if log_dir:
-        os.makedirs(log_dir, exist_ok=True)
+        _ensure_dir(log_dir)
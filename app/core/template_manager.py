@@ -24,12 +24,38 @@ while template resolution is managed by Flask's Jinja2 environment.
 """
 
 from flask import render_template
+from jinja2 import TemplateNotFound
+from collections import OrderedDict
 import os
+import sys
+import threading
+
+
+# Translation table used to rewrite hyphenated config keys for Jinja2
+_HYPHEN_TO_UNDERSCORE = str.maketrans('-', '_')
+
+# Converted keys, interned so every config load shares the same key strings.
+# Config key names are a small, stable set; the cap guards against unbounded growth.
+_UNDERSCORE_KEYS = {}
+_UNDERSCORE_KEYS_MAX = 4096
+
+# Template views of the configs recently passed to prepare_template_context:
+# the underscore-converted base context plus each converted page and its flat
+# field values, keyed by id() of the source page. ConfigManager hands out the same cached dict until
+# config.json changes, so the conversion runs once per config, not per request.
+# Views are keyed by id() of the config; a few are kept so that sites served
+# by one process do not evict each other's view.
+_template_views = OrderedDict()
+_TEMPLATE_VIEWS_MAX = 8
+_template_views_lock = threading.Lock()
 
 
 def convert_keys_to_underscore(data):
     """
-    Recursively convert dictionary keys with hyphens to underscores for Jinja2 compatibility.
+    Convert dictionary keys with hyphens to underscores for Jinja2 compatibility.
+
+    Nested dictionaries and lists are walked iteratively, so deeply nested
+    configs cannot hit Python's recursion limit.
 
     The Jinja2 templating engine cannot use hyphenated variable names directly.
     This function converts all hyphens to underscores in dictionary keys,
@@ -47,20 +73,137 @@ def convert_keys_to_underscore(data):
         Output: {'hero_title': 'Hello', 'nested_obj': {'sub_key': 'value'}}
     """
     if isinstance(data, dict):
-        new_dict = {}
-        for key, value in data.items():
-            # Convert hyphens to underscores in keys
-            new_key = key.replace('-', '_')
-            # Recursively convert nested dictionaries
-            new_dict[new_key] = convert_keys_to_underscore(value)
-        return new_dict
+        result = {}
     elif isinstance(data, list):
-        # Recursively process list items
-        return [convert_keys_to_underscore(item) for item in data]
+        result = []
     else:
         # Return primitive values as-is
         return data
 
+    # Walk the tree with an explicit stack of (source, target) containers
+    # instead of recursing, filling each new container in source order.
+    # Nested values are dispatched on their exact type: config parsed from
+    # JSON only contains plain dicts and lists, and most nodes are leaves.
+    stack = [(data, result)]
+    while stack:
+        source, target = stack.pop()
+
+        if isinstance(source, list):
+            for value in source:
+                value_type = type(value)
+                if value_type is dict:
+                    child = {}
+                    stack.append((value, child))
+                elif value_type is list:
+                    child = []
+                    stack.append((value, child))
+                else:
+                    child = value
+                target.append(child)
+            continue
+
+        for key, value in source.items():
+            # Convert hyphens to underscores in keys
+            new_key = _UNDERSCORE_KEYS.get(key)
+            if new_key is None:
+                new_key = _underscore_key(key)
+
+            value_type = type(value)
+            if value_type is dict:
+                child = {}
+                stack.append((value, child))
+            elif value_type is list:
+                child = []
+                stack.append((value, child))
+            else:
+                child = value
+            target[new_key] = child
+
+    return result
+
+
+def _underscore_key(key):
+    """
+    Convert a single key and remember the result in _UNDERSCORE_KEYS.
+
+    Args:
+        key: Dictionary key from config.json
+
+    Returns:
+        Interned key with hyphens replaced by underscores
+    """
+    new_key = sys.intern(key.translate(_HYPHEN_TO_UNDERSCORE))
+    if len(_UNDERSCORE_KEYS) < _UNDERSCORE_KEYS_MAX:
+        _UNDERSCORE_KEYS[key] = new_key
+    return new_key
+
+
+def _get_template_view(config):
+    """
+    Build (or reuse) the underscore-converted template view of a config.
+
+    Args:
+        config: Global configuration dictionary
+
+    Returns:
+        Dictionary with 'base' (global template context), 'pages' (converted
+        page dictionaries) and 'values' (field name -> value mappings), both
+        keyed by id() of the source page
+    """
+    with _template_views_lock:
+        view = _template_views.get(id(config))
+        if view is not None and view['source'] is config:
+            _template_views.move_to_end(id(config))
+            return view
+
+    config_underscore = convert_keys_to_underscore(config)
+    pages_underscore = config_underscore.get('pages', [])
+
+    view = {
+        'source': config,
+        'base': {
+            'sitename': config_underscore.get('sitename', ''),
+            'description': config_underscore.get('description', ''),
+            'keywords': config_underscore.get('keywords', []),
+            'footer': config_underscore.get('footer', {}).get('content', []),
+            'pages': pages_underscore
+        },
+        'pages': {
+            id(page): page_underscore
+            for page, page_underscore in zip(config.get('pages', []), pages_underscore)
+        },
+        'values': {
+            id(page): _field_values(page)
+            for page in config.get('pages', [])
+        }
+    }
+    # The view holds a reference to its config, so the id() key cannot be
+    # reused by another object while the entry exists
+    with _template_views_lock:
+        _template_views[id(config)] = view
+        while len(_template_views) > _TEMPLATE_VIEWS_MAX:
+            _template_views.popitem(last=False)
+    return view
+
+
+def _field_values(page_data):
+    """
+    Map a page's field names (underscore notation) to their values.
+
+    Args:
+        page_data: Page configuration dictionary
+
+    Returns:
+        Dictionary of template variable name -> field value
+    """
+    values = {}
+    for field in page_data.get('fields', []):
+        name = _UNDERSCORE_KEYS.get(field['name'])
+        if name is None:
+            name = _underscore_key(field['name'])
+        values[name] = field.get('value', '')
+    return values
+
 
 def prepare_template_context(config, page_data=None):
     """
@@ -76,27 +219,23 @@ def prepare_template_context(config, page_data=None):
     Returns:
         Dictionary with prepared context for template rendering
     """
-    # Convert all config keys with hyphens to underscores for Jinja2
-    config_underscore = convert_keys_to_underscore(config)
+    # Underscore conversion is done once per config (see _get_template_view)
+    view = _get_template_view(config)
 
     # Build base template context
-    template_data = {
-        'sitename': config_underscore.get('sitename', ''),
-        'description': config_underscore.get('description', ''),
-        'keywords': config_underscore.get('keywords', []),
-        'footer': config_underscore.get('footer', {}).get('content', []),
-        'pages': config_underscore.get('pages', [])
-    }
+    template_data = dict(view['base'])
 
     # Add page-specific data if provided
     if page_data:
-        # Convert page data keys as well
-        page_data_underscore = convert_keys_to_underscore(page_data)
+        # Pages from the same config are already converted; convert others here
+        page_data_underscore = view['pages'].get(id(page_data))
+        field_values = view['values'].get(id(page_data))
+        if page_data_underscore is None:
+            page_data_underscore = convert_keys_to_underscore(page_data)
+            field_values = _field_values(page_data)
 
         # Add field values with converted names
-        for field in page_data.get('fields', []):
-            field_name = field['name'].replace('-', '_')
-            template_data[field_name] = field.get('value', '')
+        template_data.update(field_values)
 
         # Add page metadata with converted keys
         template_data.update({
@@ -165,21 +304,21 @@ def render_page_template(template_name, config, page_data=None, logger=None):
 
         return html
 
+    except TemplateNotFound as e:
+        # The loader reports missing templates itself (and caches found ones),
+        # so no separate existence check is needed before rendering
+        if logger:
+            logger.error(f'Template not found: {e.name} (rendering {template_name})')
+        try:
+            return render_template('404.html'), 404
+        except Exception:
+            # If even 404.html is missing, return plain text
+            return "404 - Page Not Found", 404
+
     except Exception as e:
         if logger:
             logger.error(f'Template rendering error for {template_name}: {e}')
 
-        # Check if this is a template not found error
-        error_msg = str(e).lower()
-        if 'template' in error_msg and ('not found' in error_msg or 'does not exist' in error_msg):
-            if logger:
-                logger.error(f'Template not found: {template_name}')
-            try:
-                return render_template('404.html'), 404
-            except Exception:
-                # If even 404.html is missing, return plain text
-                return "404 - Page Not Found", 404
-
         # For other errors, return 500
         try:
             return render_template('500.html'), 500
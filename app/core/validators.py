@@ -6,6 +6,37 @@ Handles all validation logic for configuration, fields, and uploads.
 import os
 
 
+# Image file signatures (magic numbers) keyed by their first byte:
+# first byte -> (signature prefix or tuple of prefixes, mime type)
+_IMAGE_SIGNATURES = {
+    b'\xFF': (b'\xFF\xD8\xFF', 'image/jpeg'),  # JPEG
+    b'\x89': (b'\x89PNG\r\n\x1A\n', 'image/png'),  # PNG
+    b'G': ((b'GIF87a', b'GIF89a'), 'image/gif'),  # GIF87a / GIF89a
+    b'R': (b'RIFF', 'image/webp'),  # WebP (RIFF....WEBP)
+}
+
+# Field types accepted in page field definitions
+_VALID_FIELD_TYPES = frozenset({'text', 'textarea', 'image'})
+_VALID_FIELD_TYPES_STR = 'text, textarea, image'
+
+# Extensions accepted for image uploads
+_ALLOWED_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+_ALLOWED_IMAGE_EXTS_STR = '.jpg, .jpeg, .png, .gif, .webp'
+
+# Keys every config, page and field definition must have
+_REQUIRED_CONFIG_KEYS = ('admin-password', 'sitename', 'pages')
+_REQUIRED_PAGE_FIELDS = ('title', 'template', 'url')
+_REQUIRED_FIELD_KEYS = ('name', 'type', 'label')
+
+# Message templates for the checks run on every page and field, filled in
+# with % (prefix, ...)
+_ERR_MISSING_FIELD = "%s: Missing required field '%s'"
+_ERR_NON_EMPTY = "%s: %s must be a non-empty string"
+_ERR_NOT_STRING = "%s: %s must be a string"
+_ERR_NOT_ARRAY = "%s: %s must be an array"
+_ERR_FIELD_TYPE = "%s: Type must be one of: " + _VALID_FIELD_TYPES_STR
+
+
 # ============================================================================
 # Field Validation
 # ============================================================================
@@ -48,6 +79,9 @@ def validate_image_file(file):
     """
     Validate uploaded image file with signature check.
 
+    Only the extension and the first 12 bytes are checked; upload size is
+    limited by the application's MAX_CONTENT_LENGTH.
+
     Args:
         file: File object to validate
 
@@ -58,63 +92,64 @@ def validate_image_file(file):
         return None, "No file selected"
 
     # Check file extension
-    allowed_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
     file_ext = os.path.splitext(file.filename)[1].lower()
 
-    if file_ext not in allowed_extensions:
-        return None, f"File type {file_ext} not allowed. Use: {', '.join(allowed_extensions)}"
-
-    # Check file size (5MB limit)
-    file.seek(0, os.SEEK_END)
-    file_size = file.tell()
-    file.seek(0)  # Reset file pointer
+    if file_ext not in _ALLOWED_IMAGE_EXTS:
+        return None, f"File type {file_ext} not allowed. Use: {_ALLOWED_IMAGE_EXTS_STR}"
 
-    if file_size > 5 * 1024 * 1024:  # 5MB
-        return None, "File size must be less than 5MB"
+    # Size is enforced before the upload reaches Python: MAX_CONTENT_LENGTH
+    # (5MB) makes Werkzeug reject larger requests with 413.
 
     # Read file header for signature validation
     header = file.read(12)  # Read first 12 bytes
     file.seek(0)  # Reset file pointer
 
-    # Image file signatures (magic numbers)
-    image_signatures = {
-        b'\xFF\xD8\xFF': 'image/jpeg',  # JPEG
-        b'\x89PNG\r\n\x1A\n': 'image/png',  # PNG
-        b'GIF87a': 'image/gif',  # GIF87a
-        b'GIF89a': 'image/gif',  # GIF89a
-        b'RIFF': 'image/webp'  # WebP (RIFF....WEBP)
-    }
-
-    # Check if header matches any known image signature
-    is_valid_image = False
-    for signature, mime_type in image_signatures.items():
-        if header.startswith(signature):
-            is_valid_image = True
-            # For WebP, need additional check
-            if mime_type == 'image/webp':
-                file.seek(8)  # Skip RIFF header
-                webp_header = file.read(4)
-                file.seek(0)
-                if webp_header != b'WEBP':
-                    return None, "Invalid WebP file format"
-            break
-
-    if not is_valid_image:
+    # Pick the only signature that can match from the first byte
+    signature = _IMAGE_SIGNATURES.get(header[:1])
+    if signature is None or not header.startswith(signature[0]):
         return None, "File does not appear to be a valid image file"
 
+    # WebP is a RIFF container; the format tag follows the 4-byte size
+    if signature[1] == 'image/webp' and header[8:12] != b'WEBP':
+        return None, "Invalid WebP file format"
+
     return file, None
 
 
+def password_character_classes(password):
+    """
+    Check which character classes a password contains, in one pass.
+
+    Args:
+        password: Password to inspect
+
+    Returns:
+        Tuple of (has_upper, has_lower, has_digit)
+    """
+    has_upper = has_lower = has_digit = False
+    # Each distinct character is tested once
+    for c in set(password):
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+    return has_upper, has_lower, has_digit
+
+
 # ============================================================================
 # Configuration Schema Validation
 # ============================================================================
 
-def validate_config_schema(config):
+def validate_config_schema(config, error_limit=None):
     """
     Validate configuration structure against expected schema.
 
     Args:
         config: Configuration dictionary to validate
+        error_limit: Stop checking pages and fields once this many errors
+                     have been found (optional, checks everything if None)
 
     Returns:
         List of validation error messages
@@ -122,8 +157,7 @@ def validate_config_schema(config):
     errors = []
 
     # Check required top-level keys
-    required_keys = ['admin-password', 'sitename', 'pages']
-    for key in required_keys:
+    for key in _REQUIRED_CONFIG_KEYS:
         if key not in config:
             errors.append(f"Missing required key: {key}")
 
@@ -163,8 +197,9 @@ def validate_config_schema(config):
         else:
             urls = set()
             for i, page in enumerate(pages):
-                page_errors = validate_page_schema(page, i, urls)
-                errors.extend(page_errors)
+                if error_limit is not None and len(errors) >= error_limit:
+                    return errors
+                validate_page_schema(page, i, urls, errors=errors, error_limit=error_limit)
 
     # Validate footer (optional)
     if 'footer' in config and config['footer']:
@@ -183,7 +218,7 @@ def validate_config_schema(config):
     return errors
 
 
-def validate_page_schema(page, index, existing_urls):
+def validate_page_schema(page, index, existing_urls, errors=None, error_limit=None):
     """
     Validate individual page schema.
 
@@ -191,30 +226,33 @@ def validate_page_schema(page, index, existing_urls):
         page: Page configuration to validate
         index: Page index for error messages
         existing_urls: Set of URLs already used
+        errors: List to append error messages to (optional, new list if None)
+        error_limit: Stop checking fields once errors holds this many messages
+                     (optional, checks everything if None)
 
     Returns:
         List of validation error messages
     """
-    errors = []
-    prefix = f"Page {index+1}"
+    if errors is None:
+        errors = []
+    prefix = "Page %d" % (index + 1)
 
     # Required fields
-    required_fields = ['title', 'template', 'url']
-    for field in required_fields:
+    for field in _REQUIRED_PAGE_FIELDS:
         if field not in page:
-            errors.append(f"{prefix}: Missing required field '{field}'")
+            errors.append(_ERR_MISSING_FIELD % (prefix, field))
 
     # Validate title
     if 'title' in page:
         title = page['title']
         if not isinstance(title, str) or not title.strip():
-            errors.append(f"{prefix}: Title must be a non-empty string")
+            errors.append(_ERR_NON_EMPTY % (prefix, 'Title'))
 
     # Validate template
     if 'template' in page:
         template = page['template']
         if not isinstance(template, str) or not template.strip():
-            errors.append(f"{prefix}: Template must be a non-empty string")
+            errors.append(_ERR_NON_EMPTY % (prefix, 'Template'))
         elif not template.endswith('.html'):
             errors.append(f"{prefix}: Template must be an HTML file")
 
@@ -222,7 +260,7 @@ def validate_page_schema(page, index, existing_urls):
     if 'url' in page:
         url = page['url']
         if not isinstance(url, str) or not url.strip():
-            errors.append(f"{prefix}: URL must be a non-empty string")
+            errors.append(_ERR_NON_EMPTY % (prefix, 'URL'))
         elif not url.startswith('/'):
             errors.append(f"{prefix}: URL must start with '/'")
         elif url in existing_urls:
@@ -234,7 +272,7 @@ def validate_page_schema(page, index, existing_urls):
     if 'menu-title' in page:
         menu_title = page['menu-title']
         if not isinstance(menu_title, str):
-            errors.append(f"{prefix}: Menu title must be a string")
+            errors.append(_ERR_NOT_STRING % (prefix, 'Menu title'))
 
     # Validate SEO fields (optional)
     for seo_field in ['seo-description', 'seo-keywords']:
@@ -242,76 +280,85 @@ def validate_page_schema(page, index, existing_urls):
             value = page[seo_field]
             if seo_field == 'seo-description':
                 if not isinstance(value, str):
-                    errors.append(f"{prefix}: SEO description must be a string")
+                    errors.append(_ERR_NOT_STRING % (prefix, 'SEO description'))
                 elif len(value) > 255:
                     errors.append(f"{prefix}: SEO description must be 255 characters or less")
             elif seo_field == 'seo-keywords':
                 if not isinstance(value, list):
-                    errors.append(f"{prefix}: SEO keywords must be an array")
+                    errors.append(_ERR_NOT_ARRAY % (prefix, 'SEO keywords'))
 
     # Validate fields (optional)
     if 'fields' in page:
         fields = page['fields']
         if not isinstance(fields, list):
-            errors.append(f"{prefix}: Fields must be an array")
+            errors.append(_ERR_NOT_ARRAY % (prefix, 'Fields'))
         else:
             field_names = set()
             for i, field in enumerate(fields):
-                field_errors = validate_field_schema(field, index, i, field_names)
-                errors.extend(field_errors)
+                if error_limit is not None and len(errors) >= error_limit:
+                    break
+                validate_field_schema(field, index, i, field_names, errors=errors)
 
     return errors
 
 
-def validate_field_schema(field, page_index, field_index, existing_names):
+def _field_prefix(page_index, field_index):
+    """Build the error message prefix for a field."""
+    return "Page %d Field %d" % (page_index + 1, field_index + 1)
+
+
+def validate_field_schema(field, page_index, field_index, existing_names, errors=None):
     """
     Validate individual field schema.
 
+    The message prefix is only built when an error is found, since almost
+    every field in a saved config is valid.
+
     Args:
         field: Field configuration to validate
         page_index: Page index for error messages
         field_index: Field index for error messages
         existing_names: Set of field names already used in page
+        errors: List to append error messages to (optional, new list if None)
 
     Returns:
         List of validation error messages
     """
-    errors = []
-    prefix = f"Page {page_index+1} Field {field_index+1}"
+    if errors is None:
+        errors = []
 
     # Required fields
-    required_fields = ['name', 'type', 'label']
-    for req_field in required_fields:
+    for req_field in _REQUIRED_FIELD_KEYS:
         if req_field not in field:
-            errors.append(f"{prefix}: Missing required field '{req_field}'")
+            errors.append(_ERR_MISSING_FIELD % (_field_prefix(page_index, field_index), req_field))
 
     # Validate name
     if 'name' in field:
         name = field['name']
         if not isinstance(name, str) or not name.strip():
-            errors.append(f"{prefix}: Name must be a non-empty string")
+            errors.append(_ERR_NON_EMPTY % (_field_prefix(page_index, field_index), 'Name'))
         elif name in existing_names:
-            errors.append(f"{prefix}: Field name '{name}' is already used in this page")
+            errors.append(f"{_field_prefix(page_index, field_index)}: Field name '{name}' is already used in this page")
         else:
             existing_names.add(name)
 
     # Validate type
     if 'type' in field:
         field_type = field['type']
-        valid_types = ['text', 'textarea', 'image']
-        if field_type not in valid_types:
-            errors.append(f"{prefix}: Type must be one of: {', '.join(valid_types)}")
+        # Non-string types (lists, dicts) are unhashable for the set lookup
+        if not isinstance(field_type, str) or field_type not in _VALID_FIELD_TYPES:
+            errors.append(_ERR_FIELD_TYPE % _field_prefix(page_index, field_index))
 
     # Validate label
     if 'label' in field:
         label = field['label']
         if not isinstance(label, str) or not label.strip():
-            errors.append(f"{prefix}: Label must be a non-empty string")
+            errors.append(_ERR_NON_EMPTY % (_field_prefix(page_index, field_index), 'Label'))
 
     # Validate value (optional)
     if 'value' in field:
         value = field['value']
         if not isinstance(value, str):
-            errors.append(f"{prefix}: Value must be a string")
+            errors.append(_ERR_NOT_STRING % (_field_prefix(page_index, field_index), 'Value'))
 
     return errors
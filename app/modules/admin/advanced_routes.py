@@ -7,6 +7,7 @@ Routes for managing groups, activity, permissions, and quotas.
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from functools import wraps
 import logging
+import time
 
 from app.multisite import (
     get_group_manager, get_activity_logger,
@@ -185,7 +186,6 @@ def export_activity():
             event_type = EventType(form.event_type.data)
 
         # Generate filename
-        import time
         timestamp = time.strftime('%Y%m%d_%H%M%S')
 
         if form.format_type.data == 'json':
@@ -7,9 +7,14 @@ clearing caches, and cache warming.
 from flask import Blueprint, render_template, jsonify, request, redirect, url_for
 import logging
 
+from app.modules.auth.utils import require_admin_login
+
 cache_bp = Blueprint('cache', __name__, url_prefix='/admin/cache')
 logger = logging.getLogger(__name__)
 
+# Every route in this blueprint requires an admin login
+cache_bp.before_request(require_admin_login)
+
 # Global cache service (will be injected by app factory)
 _cache_service = None
 
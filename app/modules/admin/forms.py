@@ -3,6 +3,8 @@ Admin forms validation for WICARA CMS.
 Handles validation of admin panel forms.
 """
 
+from app.core.validators import password_character_classes
+
 
 class SettingsForm:
     """Settings form validator."""
@@ -40,14 +42,15 @@ class SettingsForm:
         # Validate keywords
         keywords_input = data.get('keywords', '').strip()
         if keywords_input:
-            keywords = [kw.strip() for kw in keywords_input.split(',') if kw.strip()]
+            # Strip each entry once, then drop the empty ones
+            keywords = [kw for kw in (k.strip() for k in keywords_input.split(',')) if kw]
             validated_data['keywords'] = keywords
         else:
             validated_data['keywords'] = []
 
         # Validate footer content
         footer_lines = data.get('footer_content', [])
-        footer_lines = [line.strip() for line in footer_lines if line.strip()]
+        footer_lines = [line for line in (l.strip() for l in footer_lines) if line]
         validated_data['footer'] = {'content': footer_lines}
 
         return len(errors) == 0, errors, validated_data
@@ -76,12 +79,14 @@ class PasswordChangeForm:
             errors.append('New password is required')
         elif len(new_password) < 8:
             errors.append('New password must be at least 8 characters long')
-        elif not any(c.isupper() for c in new_password):
-            errors.append('New password must contain at least one uppercase letter')
-        elif not any(c.islower() for c in new_password):
-            errors.append('New password must contain at least one lowercase letter')
-        elif not any(c.isdigit() for c in new_password):
-            errors.append('New password must contain at least one number')
+        else:
+            has_upper, has_lower, has_digit = password_character_classes(new_password)
+            if not has_upper:
+                errors.append('New password must contain at least one uppercase letter')
+            elif not has_lower:
+                errors.append('New password must contain at least one lowercase letter')
+            elif not has_digit:
+                errors.append('New password must contain at least one number')
 
         # Validate password confirmation
         if new_password != confirm_password:
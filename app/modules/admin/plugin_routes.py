@@ -9,16 +9,18 @@ from werkzeug.utils import secure_filename
 import os
 import logging
 
-from app.modules.auth.utils import login_required
+from app.modules.auth.utils import require_admin_login
 from app.plugins import get_plugin_manager
 from app.plugins.installer import PluginInstaller
 
 plugin_bp = Blueprint('plugins', __name__, url_prefix='/admin/plugins')
 logger = logging.getLogger(__name__)
 
+# Every route in this blueprint requires an admin login
+plugin_bp.before_request(require_admin_login)
+
 
 @plugin_bp.route('/')
-@login_required
 def index():
     """
     Plugin dashboard - list all plugins with status.
@@ -76,7 +78,6 @@ def index():
 
 
 @plugin_bp.route('/<plugin_name>')
-@login_required
 def detail(plugin_name):
     """
     Plugin detail page.
@@ -130,7 +131,6 @@ def detail(plugin_name):
 
 
 @plugin_bp.route('/<plugin_name>/enable', methods=['POST'])
-@login_required
 def enable(plugin_name):
     """Enable a plugin."""
     try:
@@ -154,7 +154,6 @@ def enable(plugin_name):
 
 
 @plugin_bp.route('/<plugin_name>/disable', methods=['POST'])
-@login_required
 def disable(plugin_name):
     """Disable a plugin."""
     try:
@@ -178,7 +177,6 @@ def disable(plugin_name):
 
 
 @plugin_bp.route('/<plugin_name>/uninstall', methods=['POST'])
-@login_required
 def uninstall(plugin_name):
     """Uninstall a plugin."""
     try:
@@ -205,7 +203,6 @@ def uninstall(plugin_name):
 
 
 @plugin_bp.route('/install', methods=['GET', 'POST'])
-@login_required
 def install():
     """
     Install plugin wizard.
@@ -271,7 +268,6 @@ def install():
 
 
 @plugin_bp.route('/hooks')
-@login_required
 def hooks():
     """
     View all registered hooks.
@@ -314,7 +310,6 @@ def hooks():
 
 
 @plugin_bp.route('/api/load/<plugin_name>', methods=['POST'])
-@login_required
 def load_plugin(plugin_name):
     """Load a plugin dynamically."""
     try:
@@ -6,21 +6,45 @@ Handles dashboard, page editing, settings, and management.
 from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app
 from werkzeug.security import generate_password_hash
 import os
-import uuid
+import time
 
 from app.core import (
     load_config, save_config, validate_field_value, validate_image_file,
-    sanitize_filename, cleanup_unused_images, ensure_directories
+    save_upload_file, cleanup_unused_images, ensure_directories
 )
 from app.core.config_manager import ConfigManager
-from app.modules.auth.utils import login_required
+from app.modules.auth.utils import (
+    require_admin_login, check_admin_password, pad_auth_duration, login_rate_limited
+)
 from app.modules.admin.forms import SettingsForm, PasswordChangeForm
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
+# Every route in this blueprint requires an admin login
+admin_bp.before_request(require_admin_login)
+
+
+def _image_in_use(config, image_value):
+    """
+    Check whether any image field in the config references an image path.
+
+    Uploads are content-addressed, so several fields may share one file.
+
+    Args:
+        config: Configuration dictionary
+        image_value: Image path as stored in a field value
+
+    Returns:
+        True if the image is referenced, False otherwise
+    """
+    for page in config.get('pages', []):
+        for field in page.get('fields', []):
+            if field.get('type') == 'image' and field.get('value') == image_value:
+                return True
+    return False
+
 
 @admin_bp.route('/')
-@login_required
 def dashboard():
     """
     Admin dashboard route.
@@ -32,7 +56,7 @@ def dashboard():
         site_manager=getattr(current_app, 'site_manager', None),
         logger=current_app.logger
     )
-    config = config_manager.load()
+    config = config_manager.load(readonly=True)
 
     if not config:
         return render_template('admin/500.html'), 500
@@ -41,7 +65,6 @@ def dashboard():
 
 
 @admin_bp.route('/edit/<int:page_index>', methods=['GET', 'POST'])
-@login_required
 def edit_page(page_index):
     """
     Edit page content route.
@@ -79,29 +102,30 @@ def edit_page(page_index):
             field_label = field.get('label', field_name)
 
             if field['type'] == 'image':
-                if 'file' in request.files:
-                    file = request.files[field_name]
-                    if file and file.filename:
-                        # Validate image file
-                        validated_file, error = validate_image_file(file)
-                        if error:
-                            validation_errors.append(f"{field_label}: {error}")
-                        else:
-                            # Delete old image if exists
-                            old_value = field.get('value', '')
-                            if old_value and old_value.startswith('/static/images/uploads/'):
-                                old_file_path = old_value[1:]  # Remove leading slash
-                                if os.path.exists(old_file_path):
-                                    os.remove(old_file_path)
-
-                            # Save new image with site-aware path
-                            safe_filename = sanitize_filename(file.filename)
-                            unique_filename = f"{uuid.uuid4().hex}_{safe_filename}"
-                            file_path = os.path.join(upload_folder, unique_filename)
-                            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                            file.save(file_path)
-                            field['value'] = f"/static/images/uploads/{unique_filename}"
-                            current_app.logger.info(f'Image uploaded: {unique_filename}')
+                file = request.files.get(field_name)
+                if file and file.filename:
+                    # Validate image file
+                    validated_file, error = validate_image_file(file)
+                    if error:
+                        validation_errors.append(f"{field_label}: {error}")
+                    else:
+                        # Save new image with site-aware path; identical uploads share one file
+                        file_path, unique_filename = save_upload_file(file, upload_folder=upload_folder)
+                        old_value = field.get('value', '')
+                        field['value'] = f"/static/images/uploads/{unique_filename}"
+                        current_app.logger.info(f'Image uploaded: {unique_filename}')
+
+                        # Delete old image unless another field still uses it
+                        if (old_value and old_value != field['value']
+                                and old_value.startswith('/static/images/uploads/')
+                                and not _image_in_use(config, old_value)):
+                            old_file_path = os.path.join(upload_folder, os.path.basename(old_value))
+                            try:
+                                os.remove(old_file_path)
+                            except FileNotFoundError:
+                                pass
+                            except OSError as e:
+                                current_app.logger.warning(f'Could not remove old image {old_file_path}: {e}')
             else:
                 # Validate text/textarea fields
                 new_value = request.form.get(field_name, '').strip()
@@ -126,7 +150,6 @@ def edit_page(page_index):
 
 
 @admin_bp.route('/settings', methods=['GET', 'POST'])
-@login_required
 def settings():
     """
     Admin settings route.
@@ -177,7 +200,6 @@ def settings():
 
 
 @admin_bp.route('/change-password', methods=['GET', 'POST'])
-@login_required
 def change_password():
     """
     Change admin password route.
@@ -201,13 +223,8 @@ def change_password():
             flash('Configuration error', 'error')
             return render_template('admin/change_password.html')
 
-        # Validate current password
-        from werkzeug.security import check_password_hash
-        if not check_password_hash(config['admin-password'], current_password):
-            flash('Current password is incorrect', 'error')
-            return render_template('admin/change_password.html')
-
-        # Validate new password
+        # Validate new password first: it is cheap, while checking the
+        # current password runs the (deliberately slow) scrypt hash
         is_valid, errors = PasswordChangeForm.validate(
             config['admin-password'],
             new_password,
@@ -217,21 +234,39 @@ def change_password():
         if not is_valid:
             for error in errors:
                 flash(error, 'error')
+            return render_template('admin/change_password.html')
+
+        # Current-password guesses count against the same per-client limit
+        # as logins, checked before any scrypt work
+        if login_rate_limited(request.remote_addr,
+                              current_app.config.get('LOGIN_ATTEMPTS_PER_MINUTE', 0)):
+            flash('Too many attempts. Please try again in a minute.', 'error')
+            current_app.logger.warning(f'Password change rate limit hit: {request.remote_addr}')
+            return render_template('admin/change_password.html'), 429
+
+        # Validate current password, taking at least LOGIN_MIN_SECONDS either way
+        started = time.monotonic()
+        password_ok = bool(current_password) and check_admin_password(
+            config.get('admin-password', ''), current_password
+        )
+        pad_auth_duration(started, current_app.config.get('LOGIN_MIN_SECONDS', 0))
+        if not password_ok:
+            flash('Current password is incorrect', 'error')
+            return render_template('admin/change_password.html')
+
+        # Update password
+        config['admin-password'] = generate_password_hash(new_password, method='scrypt')
+        if config_manager.save(config):
+            flash('Password changed successfully', 'success')
+            current_app.logger.info('Admin password changed')
+            return redirect(url_for('admin.dashboard'))
         else:
-            # Update password
-            config['admin-password'] = generate_password_hash(new_password, method='scrypt')
-            if config_manager.save(config):
-                flash('Password changed successfully', 'success')
-                current_app.logger.info('Admin password changed')
-                return redirect(url_for('admin.dashboard'))
-            else:
-                flash('Error updating password', 'error')
+            flash('Error updating password', 'error')
 
     return render_template('admin/change_password.html')
 
 
 @admin_bp.route('/cleanup', methods=['POST'])
-@login_required
 def cleanup():
     """
     Cleanup unused images route.
@@ -243,7 +278,7 @@ def cleanup():
         site_manager=getattr(current_app, 'site_manager', None),
         logger=current_app.logger
     )
-    config = config_manager.load()
+    config = config_manager.load(readonly=True)
 
     if not config:
         flash('Configuration error', 'error')
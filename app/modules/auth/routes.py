@@ -4,14 +4,58 @@ Handles login and logout operations.
 """
 
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash, current_app
-from werkzeug.security import check_password_hash
 from datetime import datetime
+import time
 from app.core import load_config
 from app.core.config_manager import ConfigManager
+from app.modules.auth.utils import (
+    is_recent_failed_login, remember_failed_login, login_rate_limited,
+    check_admin_password, pad_auth_duration
+)
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/admin')
 
 
+def _check_login(password):
+    """
+    Check a submitted admin password and log in on success.
+
+    Args:
+        password: Submitted password
+
+    Returns:
+        Redirect to the dashboard on success, otherwise None
+    """
+    if not password:
+        # Nothing to check: skip loading the config and hashing
+        flash('Invalid password', 'error')
+        return None
+
+    # ECS: Use ConfigManager with site_manager for Engine-Content Separation
+    config_manager = ConfigManager(
+        site_manager=getattr(current_app, 'site_manager', None),
+        logger=current_app.logger
+    )
+    config = config_manager.load(readonly=True)
+
+    password_hash = config.get('admin-password', '') if config else ''
+    # A password that just failed against this hash is rejected without
+    # running the (deliberately slow) scrypt check again
+    if (not (password_hash and is_recent_failed_login(password, password_hash))
+            and check_admin_password(password_hash, password)):
+        session['admin_logged_in'] = True
+        session['login_time'] = datetime.now().timestamp()
+        flash('Login successful', 'success')
+        current_app.logger.info('Admin login successful')
+        return redirect(url_for('admin.dashboard'))
+
+    if password_hash:
+        remember_failed_login(password, password_hash)
+    flash('Invalid password', 'error')
+    current_app.logger.warning('Failed admin login attempt')
+    return None
+
+
 @auth_bp.route('/login', methods=['GET', 'POST'])
 def login():
     """
@@ -21,24 +65,19 @@ def login():
     POST: Process login with password
     """
     if request.method == 'POST':
-        password = request.form.get('password')
-
-        # ECS: Use ConfigManager with site_manager for Engine-Content Separation
-        config_manager = ConfigManager(
-            site_manager=getattr(current_app, 'site_manager', None),
-            logger=current_app.logger
-        )
-        config = config_manager.load()
-
-        if config and check_password_hash(config['admin-password'], password):
-            session['admin_logged_in'] = True
-            session['login_time'] = datetime.now().timestamp()
-            flash('Login successful', 'success')
-            current_app.logger.info('Admin login successful')
-            return redirect(url_for('admin.dashboard'))
-        else:
-            flash('Invalid password', 'error')
-            current_app.logger.warning('Failed admin login attempt')
+        if login_rate_limited(request.remote_addr,
+                              current_app.config.get('LOGIN_ATTEMPTS_PER_MINUTE', 0)):
+            flash('Too many login attempts. Please try again in a minute.', 'error')
+            current_app.logger.warning(f'Login rate limit hit: {request.remote_addr}')
+            return render_template('admin/login.html'), 429
+
+        started = time.monotonic()
+        response = _check_login(request.form.get('password', ''))
+        # Every outcome takes at least LOGIN_MIN_SECONDS, so timing does not
+        # tell an empty, repeated, wrong or unconfigured password apart
+        pad_auth_duration(started, current_app.config.get('LOGIN_MIN_SECONDS', 0))
+        if response is not None:
+            return response
 
     return render_template('admin/login.html')
 
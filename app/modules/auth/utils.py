@@ -3,8 +3,39 @@ Authentication utilities for WICARA CMS.
 Provides decorators and helpers for authentication.
 """
 
-from flask import session, redirect, url_for
+from flask import session, redirect, url_for, request, current_app
+from werkzeug.security import check_password_hash, generate_password_hash
 from functools import wraps
+from collections import OrderedDict, deque
+import hashlib
+import hmac
+import os
+import threading
+import time
+
+
+# Recently rejected (password, hash) pairs, keyed by a BLAKE2b digest so no
+# plaintext is kept. A repeat of the same wrong password within
+# FAILED_LOGIN_TTL seconds is rejected without running the scrypt check again.
+FAILED_LOGIN_TTL = 5.0
+_FAILED_LOGIN_MAX = 1024
+_recent_failed = OrderedDict()
+
+# Login attempt timestamps per client IP over the last LOGIN_WINDOW seconds
+LOGIN_WINDOW = 60.0
+_LOGIN_CLIENTS_MAX = 4096
+_login_attempts = {}
+
+_login_lock = threading.Lock()
+
+# Parsed scrypt password hashes: hash string -> (salt, digest, n, r, p), or
+# None for hashes of other methods
+_PASSWORD_HASH_MAX = 64
+_password_hashes = {}
+
+# Hash checked instead when no admin password is configured, so that case
+# costs the same scrypt work as a real check. Generated on first use.
+_dummy_password_hash = None
 
 
 def login_required(f):
@@ -27,13 +58,35 @@ def login_required(f):
     return decorated_function
 
 
+def require_admin_login():
+    """
+    before_request handler for blueprints where every route needs a login.
+
+    Register with blueprint.before_request(require_admin_login) instead of
+    decorating each view with login_required. Flask runs it before the view
+    is dispatched, and a returned response ends the request there.
+
+    Returns:
+        Redirect to the login page if not logged in, otherwise None
+    """
+    if not session.get('admin_logged_in'):
+        return redirect(url_for('auth.login'))
+    return None
+
+
 def is_admin_logged_in():
     """
     Check if admin user is currently logged in.
 
+    Requests without a session cookie are answered from request.cookies
+    alone. Touching the session marks it accessed, which makes Flask add
+    'Vary: Cookie' to anonymous (cacheable) public responses.
+
     Returns:
         True if logged in, False otherwise
     """
+    if current_app.session_interface.get_cookie_name(current_app) not in request.cookies:
+        return False
     return session.get('admin_logged_in', False)
 
 
@@ -45,3 +98,183 @@ def get_login_time():
         Login timestamp or None
     """
     return session.get('login_time')
+
+
+def _failed_login_key(password, password_hash):
+    """Digest identifying a (password, stored hash) pair."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(password.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(password_hash.encode('utf-8'))
+    return digest.digest()
+
+
+def is_recent_failed_login(password, password_hash):
+    """
+    Check whether a password was rejected for this hash moments ago.
+
+    Args:
+        password: Submitted password
+        password_hash: Stored admin password hash
+
+    Returns:
+        True if the same pair failed within FAILED_LOGIN_TTL seconds
+    """
+    key = _failed_login_key(password, password_hash)
+    with _login_lock:
+        failed_at = _recent_failed.get(key)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < FAILED_LOGIN_TTL:
+            return True
+        del _recent_failed[key]
+        return False
+
+
+def remember_failed_login(password, password_hash):
+    """
+    Record a rejected password for this hash.
+
+    Args:
+        password: Submitted password
+        password_hash: Stored admin password hash
+    """
+    key = _failed_login_key(password, password_hash)
+    with _login_lock:
+        _recent_failed[key] = time.monotonic()
+        _recent_failed.move_to_end(key)
+        while len(_recent_failed) > _FAILED_LOGIN_MAX:
+            _recent_failed.popitem(last=False)
+
+
+def login_rate_limited(client_id, max_attempts):
+    """
+    Record a login attempt and check the client's attempt rate.
+
+    Args:
+        client_id: Client identifier (remote address)
+        max_attempts: Allowed attempts per LOGIN_WINDOW seconds (0 disables)
+
+    Returns:
+        True if the client exceeded the limit, False otherwise
+    """
+    if not max_attempts:
+        return False
+
+    now = time.monotonic()
+    with _login_lock:
+        attempts = _login_attempts.get(client_id)
+        if attempts is None:
+            if len(_login_attempts) >= _LOGIN_CLIENTS_MAX:
+                # Drop clients with no attempts inside the window
+                for stale in [c for c, a in _login_attempts.items()
+                              if not a or now - a[-1] >= LOGIN_WINDOW]:
+                    del _login_attempts[stale]
+            attempts = _login_attempts[client_id] = deque()
+
+        while attempts and now - attempts[0] >= LOGIN_WINDOW:
+            attempts.popleft()
+
+        if len(attempts) >= max_attempts:
+            return True
+
+        attempts.append(now)
+        return False
+
+
+def _parse_password_hash(password_hash):
+    """
+    Split a werkzeug scrypt hash ("scrypt:n:r:p$salt$hex") into its parts.
+
+    Args:
+        password_hash: Stored password hash
+
+    Returns:
+        Tuple of (salt, digest, n, r, p), or None if not a scrypt hash
+    """
+    try:
+        method, salt, hashval = password_hash.split('$', 2)
+        params = method.split(':')
+        if params[0] != 'scrypt':
+            return None
+        if len(params) == 4:
+            n, r, p = int(params[1]), int(params[2]), int(params[3])
+        else:
+            # werkzeug defaults for a bare "scrypt" method
+            n, r, p = 2 ** 15, 8, 1
+        return salt.encode('utf-8'), bytes.fromhex(hashval), n, r, p
+    except ValueError:
+        return None
+
+
+def verify_password(password_hash, password):
+    """
+    Check a password against a stored werkzeug password hash.
+
+    scrypt hashes are parsed once and verified with hashlib.scrypt directly;
+    other methods go through werkzeug's check_password_hash.
+
+    Args:
+        password_hash: Stored password hash
+        password: Submitted password
+
+    Returns:
+        True if the password matches, False otherwise
+    """
+    if password_hash in _password_hashes:
+        parsed = _password_hashes[password_hash]
+    else:
+        parsed = _parse_password_hash(password_hash)
+        if len(_password_hashes) >= _PASSWORD_HASH_MAX:
+            _password_hashes.clear()
+        _password_hashes[password_hash] = parsed
+
+    if parsed is None:
+        return check_password_hash(password_hash, password)
+
+    salt, expected, n, r, p = parsed
+    derived = hashlib.scrypt(
+        password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+        maxmem=132 * n * r * p, dklen=len(expected)
+    )
+    return hmac.compare_digest(derived, expected)
+
+
+def check_admin_password(password_hash, password):
+    """
+    Check a password against the stored admin hash, always running the KDF.
+
+    When no hash is configured the password is checked against a dummy hash
+    and rejected, so a missing password takes as long as a wrong one.
+
+    Args:
+        password_hash: Stored admin password hash (may be empty)
+        password: Submitted password
+
+    Returns:
+        True if the password matches, False otherwise
+    """
+    global _dummy_password_hash
+
+    if password_hash:
+        return verify_password(password_hash, password)
+
+    if _dummy_password_hash is None:
+        _dummy_password_hash = generate_password_hash(os.urandom(16).hex(), method='scrypt')
+    verify_password(_dummy_password_hash, password)
+    return False
+
+
+def pad_auth_duration(started, min_seconds):
+    """
+    Sleep until at least min_seconds have passed since started.
+
+    Gives every outcome of a password check the same minimum response time.
+
+    Args:
+        started: time.monotonic() value taken before the check
+        min_seconds: Minimum duration in seconds (0 disables)
+    """
+    remaining = min_seconds - (time.monotonic() - started)
+    if remaining > 0:
+        time.sleep(remaining)
@@ -5,6 +5,7 @@ Command-line interface for CMS management.
 
 from app.modules.cli.commands import (
     create_page,
+    create_pages,
     list_pages,
     delete_page,
     change_password,
@@ -28,6 +29,7 @@ from app.modules.cli.plugin_commands import (
 
 __all__ = [
     'create_page',
+    'create_pages',
     'list_pages',
     'delete_page',
     'change_password',
@@ -5,12 +5,156 @@ Page management and utility commands for command-line use.
 
 import json
 import os
+import sys
 import getpass
 from werkzeug.security import generate_password_hash
-from app.core import load_config, save_config
+from app.core import load_config, save_config, password_character_classes
+
+
+# Output of show_help(), written in one call
+_HELP_TEXT = """\
+Wicara CMS Management Commands
+================================================================================
+Usage: python run.py <command> [arguments]
+
+Page Management Commands:
+--------------------------------------------------------------------------------
+  create-page <title> <template> <url> [menu-title]
+    Create a new page
+    Example: python run.py create-page "About Us" about.html /about "About"
+
+  create-pages <file.json>
+    Create several pages at once from a JSON list of
+    {"title", "template", "url", "menu_title"} objects (one config write)
+    Example: python run.py create-pages pages.json
+
+  list-pages
+    List all pages with details
+    Example: python run.py list-pages
+
+  delete-page <url>
+    Delete a page by URL
+    Example: python run.py delete-page /about
+
+Plugin Management Commands:
+--------------------------------------------------------------------------------
+  plugin-list
+    List all installed plugins with status
+    Example: python run.py plugin-list
+
+  plugin-install <source>
+    Install plugin from ZIP file or directory
+    Example: python run.py plugin-install my-plugin.zip
+    Example: python run.py plugin-install /path/to/plugin-dir
+
+  plugin-uninstall <name> [--force]
+    Uninstall a plugin
+    Example: python run.py plugin-uninstall my-plugin
+    Example: python run.py plugin-uninstall my-plugin --force
+
+  plugin-enable <name>
+    Enable a plugin
+    Example: python run.py plugin-enable my-plugin
+
+  plugin-disable <name>
+    Disable a plugin
+    Example: python run.py plugin-disable my-plugin
+
+  plugin-info <name>
+    Show detailed plugin information
+    Example: python run.py plugin-info my-plugin
+
+Plugin Development Commands:
+--------------------------------------------------------------------------------
+  plugin-create
+    Interactive wizard for creating a new plugin
+    Example: python run.py plugin-create
+
+  plugin-validate <name>
+    Validate plugin structure and code
+    Example: python run.py plugin-validate my-plugin
+
+  plugin-package <name>
+    Create ZIP package for distribution
+    Example: python run.py plugin-package my-plugin
+
+Hook Inspection Commands:
+--------------------------------------------------------------------------------
+  hook-list
+    List all available hooks in Wicara
+    Example: python run.py hook-list
+
+  hook-handlers <hook-name>
+    Show registered handlers for a specific hook
+    Example: python run.py hook-handlers before_page_render
+
+  hook-stats
+    Show hook execution statistics
+    Example: python run.py hook-stats
+
+System Commands:
+--------------------------------------------------------------------------------
+  change-password [password]
+    Change admin password
+    Example: python run.py change-password
+    Example: python run.py change-password "newpassword123"
+
+  migrate
+    Migrate from legacy structure to sites/ structure (ECS)
+    This command safely copies content to sites/default/ directory
+    Example: python run.py migrate
+
+  --quiet
+    Page and password commands print only errors (to stderr)
+    Example: python run.py create-page "About Us" about.html /about --quiet
+
+  help
+    Show this help message
+    Example: python run.py help
+
+  run
+    Start the web server (default: port 5555)
+    Example: python run.py run
+
+Environment Variables:
+--------------------------------------------------------------------------------
+  FLASK_ENV      - development, production, or testing (default: development)
+  SECRET_KEY     - Secret key for session management (required in production)
+  LOG_LEVEL      - DEBUG, INFO, WARNING, ERROR (default: INFO)
+  LOG_FILE       - Path to log file (default: logs/wicara.log)
+  HOST           - Server host (default: 0.0.0.0)
+  PORT           - Server port (default: 5555)
+
+Configuration:
+--------------------------------------------------------------------------------
+  Config file: config.json
+  Plugin directory: app/plugins/installed/
+  For configuration details, see documentation at /docs
 
+"""
+
+
+def _url_index(config):
+    """
+    Map each page URL to its position in config['pages'].
 
-def create_page(title, template, url, menu_title=None, site_manager=None):
+    Built once per command so URL lookups are dict lookups instead of a
+    scan over every page. Page URLs are unique (enforced by schema
+    validation); if a URL repeats, the first page wins.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Dictionary of URL -> page index
+    """
+    index = {}
+    for i, page in enumerate(config.get('pages', [])):
+        index.setdefault(page.get('url'), i)
+    return index
+
+
+def create_page(title, template, url, menu_title=None, site_manager=None, quiet=False):
     """
     Create a new page via CLI.
 
@@ -20,6 +164,7 @@ def create_page(title, template, url, menu_title=None, site_manager=None):
         url: Page URL
         menu_title: Menu title (optional)
         site_manager: Optional SiteManager instance for ECS path resolution
+        quiet: Skip success messages (errors still go to stderr)
 
     Returns:
         True if successful, False otherwise
@@ -32,10 +177,9 @@ def create_page(title, template, url, menu_title=None, site_manager=None):
         return False
 
     # Check if URL already exists
-    for page in config.get('pages', []):
-        if page.get('url') == url:
-            print(f'Error: URL "{url}" already exists')
-            return False
+    if url in _url_index(config):
+        print(f'Error: URL "{url}" already exists', file=sys.stderr)
+        return False
 
     # Create new page
     new_page = {
@@ -51,7 +195,97 @@ def create_page(title, template, url, menu_title=None, site_manager=None):
     config['pages'].append(new_page)
 
     if save_config(config, config_path, validate=False):
-        print(f'Successfully created page: {title} ({url})')
+        if not quiet:
+            print(f'Successfully created page: {title} ({url})')
+        return True
+    else:
+        return False
+
+
+def create_pages(batch_file, site_manager=None, quiet=False):
+    """
+    Create several pages from a JSON file via CLI.
+
+    The file holds a list of page objects with "title", "template", "url"
+    and an optional "menu_title" (or "menu-title"). The config is loaded and
+    saved once for the whole batch. Nothing is saved if any entry is invalid
+    or its URL is already taken.
+
+    Args:
+        batch_file: Path to JSON file with the pages to create
+        site_manager: Optional SiteManager instance for ECS path resolution
+        quiet: Skip success messages (errors still go to stderr)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        with open(batch_file, 'r', encoding='utf-8') as f:
+            batch = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f'Error: Could not read "{batch_file}": {e}', file=sys.stderr)
+        return False
+
+    if not isinstance(batch, list) or not batch:
+        print('Error: Batch file must contain a non-empty list of pages', file=sys.stderr)
+        return False
+
+    # Use SiteManager for path resolution if available (ECS-10)
+    config_path = site_manager.get_config_path() if site_manager else 'config.json'
+
+    config = load_config(config_path, validate=False)
+    if not config:
+        return False
+
+    url_index = _url_index(config)
+    new_pages = []
+
+    for i, entry in enumerate(batch, 1):
+        # JSON values can be of any type; pages are saved unvalidated, so
+        # anything the config schema would reject is refused here
+        if not isinstance(entry, dict) or not all(
+            isinstance(entry.get(key), str) and entry[key].strip()
+            for key in ('title', 'template', 'url')
+        ):
+            print(f'Error: Entry {i} needs "title", "template" and "url" strings', file=sys.stderr)
+            return False
+
+        if not entry['template'].endswith('.html'):
+            print(f'Error: Entry {i} "template" must be an HTML file', file=sys.stderr)
+            return False
+
+        url = entry['url']
+        if not url.startswith('/'):
+            print(f'Error: Entry {i} "url" must start with "/"', file=sys.stderr)
+            return False
+
+        menu_title = entry.get('menu_title', entry.get('menu-title'))
+        if menu_title is not None and not isinstance(menu_title, str):
+            print(f'Error: Entry {i} "menu_title" must be a string', file=sys.stderr)
+            return False
+
+        if url in url_index:
+            print(f'Error: URL "{url}" already exists', file=sys.stderr)
+            return False
+        url_index[url] = len(config['pages']) + len(new_pages)
+
+        new_page = {
+            'title': entry['title'],
+            'template': entry['template'],
+            'url': url,
+            'fields': []
+        }
+
+        if menu_title:
+            new_page['menu-title'] = menu_title
+
+        new_pages.append(new_page)
+
+    config['pages'].extend(new_pages)
+
+    if save_config(config, config_path, validate=False):
+        if not quiet:
+            print(f'Successfully created {len(new_pages)} page(s)')
         return True
     else:
         return False
@@ -67,7 +301,8 @@ def list_pages(site_manager=None):
     # Use SiteManager for path resolution if available (ECS-10)
     config_path = site_manager.get_config_path() if site_manager else 'config.json'
 
-    config = load_config(config_path, validate=False)
+    # Read-only: use the cached config as is instead of a private copy
+    config = load_config(config_path, validate=False, readonly=True)
     if not config:
         return
 
@@ -76,24 +311,21 @@ def list_pages(site_manager=None):
         print('No pages found')
         return
 
-    print('\nPages:')
-    print('-' * 60)
+    # Build the whole listing and write it once instead of five prints per page
+    lines = ['', 'Pages:', '-' * 60]
     for i, page in enumerate(pages, 1):
         title = page.get('title', 'Untitled')
-        url = page.get('url', '/no-url')
-        template = page.get('template', 'no-template')
-        menu_title = page.get('menu-title', title)
-        fields_count = len(page.get('fields', []))
+        lines.append(f'{i:2d}. {title}')
+        lines.append(f"    URL: {page.get('url', '/no-url')}")
+        lines.append(f"    Template: {page.get('template', 'no-template')}")
+        lines.append(f"    Menu Title: {page.get('menu-title', title)}")
+        lines.append(f"    Fields: {len(page.get('fields', []))}")
+        lines.append('')
 
-        print(f'{i:2d}. {title}')
-        print(f'    URL: {url}')
-        print(f'    Template: {template}')
-        print(f'    Menu Title: {menu_title}')
-        print(f'    Fields: {fields_count}')
-        print()
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
-def change_password(new_password=None, site_manager=None):
+def change_password(new_password=None, site_manager=None, quiet=False):
     """
     Change admin password via CLI.
 
@@ -102,6 +334,7 @@ def change_password(new_password=None, site_manager=None):
     Args:
         new_password: New password (optional). If not provided, prompts securely.
         site_manager: Optional SiteManager instance for ECS path resolution
+        quiet: Skip success messages (errors still go to stderr)
 
     Returns:
         True if successful, False otherwise
@@ -128,11 +361,12 @@ def change_password(new_password=None, site_manager=None):
     else:
         if len(new_password) < 8:
             errors.append('New password must be at least 8 characters long')
-        if not any(c.isupper() for c in new_password):
+        has_upper, has_lower, has_digit = password_character_classes(new_password)
+        if not has_upper:
             errors.append('New password must contain at least one uppercase letter')
-        if not any(c.islower() for c in new_password):
+        if not has_lower:
             errors.append('New password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in new_password):
+        if not has_digit:
             errors.append('New password must contain at least one number')
 
     # Validate password confirmation
@@ -141,9 +375,9 @@ def change_password(new_password=None, site_manager=None):
 
     # Show errors if any
     if errors:
-        print('Error: Password validation failed')
+        print('Error: Password validation failed', file=sys.stderr)
         for error in errors:
-            print(f'  - {error}')
+            print(f'  - {error}', file=sys.stderr)
         return False
 
     # Hash password with scrypt (same method as admin)
@@ -151,20 +385,22 @@ def change_password(new_password=None, site_manager=None):
     config['admin-password'] = hashed_password
 
     if save_config(config, config_path, validate=False):
-        print('Successfully changed admin password')
+        if not quiet:
+            print('Successfully changed admin password')
         return True
     else:
-        print('Error: Failed to save password')
+        print('Error: Failed to save password', file=sys.stderr)
         return False
 
 
-def delete_page(url, site_manager=None):
+def delete_page(url, site_manager=None, quiet=False):
     """
     Delete a page by URL via CLI.
 
     Args:
         url: Page URL to delete
         site_manager: Optional SiteManager instance for ECS path resolution
+        quiet: Skip success messages (errors still go to stderr)
 
     Returns:
         True if successful, False otherwise
@@ -176,18 +412,16 @@ def delete_page(url, site_manager=None):
     if not config:
         return False
 
-    pages = config.get('pages', [])
-    original_count = len(pages)
-
     # Remove page with matching URL
-    config['pages'] = [page for page in pages if page.get('url') != url]
-
-    if len(config['pages']) == original_count:
-        print(f'Error: Page with URL "{url}" not found')
+    index = _url_index(config).get(url)
+    if index is None:
+        print(f'Error: Page with URL "{url}" not found', file=sys.stderr)
         return False
+    del config['pages'][index]
 
     if save_config(config, config_path, validate=False):
-        print(f'Successfully deleted page: {url}')
+        if not quiet:
+            print(f'Successfully deleted page: {url}')
         return True
     else:
         return False
@@ -195,112 +429,4 @@ def delete_page(url, site_manager=None):
 
 def show_help():
     """Show CLI help."""
-    print('Wicara CMS Management Commands')
-    print('=' * 80)
-    print('Usage: python run.py <command> [arguments]')
-    print()
-    print('Page Management Commands:')
-    print('-' * 80)
-    print('  create-page <title> <template> <url> [menu-title]')
-    print('    Create a new page')
-    print('    Example: python run.py create-page "About Us" about.html /about "About"')
-    print()
-    print('  list-pages')
-    print('    List all pages with details')
-    print('    Example: python run.py list-pages')
-    print()
-    print('  delete-page <url>')
-    print('    Delete a page by URL')
-    print('    Example: python run.py delete-page /about')
-    print()
-    print('Plugin Management Commands:')
-    print('-' * 80)
-    print('  plugin-list')
-    print('    List all installed plugins with status')
-    print('    Example: python run.py plugin-list')
-    print()
-    print('  plugin-install <source>')
-    print('    Install plugin from ZIP file or directory')
-    print('    Example: python run.py plugin-install my-plugin.zip')
-    print('    Example: python run.py plugin-install /path/to/plugin-dir')
-    print()
-    print('  plugin-uninstall <name> [--force]')
-    print('    Uninstall a plugin')
-    print('    Example: python run.py plugin-uninstall my-plugin')
-    print('    Example: python run.py plugin-uninstall my-plugin --force')
-    print()
-    print('  plugin-enable <name>')
-    print('    Enable a plugin')
-    print('    Example: python run.py plugin-enable my-plugin')
-    print()
-    print('  plugin-disable <name>')
-    print('    Disable a plugin')
-    print('    Example: python run.py plugin-disable my-plugin')
-    print()
-    print('  plugin-info <name>')
-    print('    Show detailed plugin information')
-    print('    Example: python run.py plugin-info my-plugin')
-    print()
-    print('Plugin Development Commands:')
-    print('-' * 80)
-    print('  plugin-create')
-    print('    Interactive wizard for creating a new plugin')
-    print('    Example: python run.py plugin-create')
-    print()
-    print('  plugin-validate <name>')
-    print('    Validate plugin structure and code')
-    print('    Example: python run.py plugin-validate my-plugin')
-    print()
-    print('  plugin-package <name>')
-    print('    Create ZIP package for distribution')
-    print('    Example: python run.py plugin-package my-plugin')
-    print()
-    print('Hook Inspection Commands:')
-    print('-' * 80)
-    print('  hook-list')
-    print('    List all available hooks in Wicara')
-    print('    Example: python run.py hook-list')
-    print()
-    print('  hook-handlers <hook-name>')
-    print('    Show registered handlers for a specific hook')
-    print('    Example: python run.py hook-handlers before_page_render')
-    print()
-    print('  hook-stats')
-    print('    Show hook execution statistics')
-    print('    Example: python run.py hook-stats')
-    print()
-    print('System Commands:')
-    print('-' * 80)
-    print('  change-password [password]')
-    print('    Change admin password')
-    print('    Example: python run.py change-password')
-    print('    Example: python run.py change-password "newpassword123"')
-    print()
-    print('  migrate')
-    print('    Migrate from legacy structure to sites/ structure (ECS)')
-    print('    This command safely copies content to sites/default/ directory')
-    print('    Example: python run.py migrate')
-    print()
-    print('  help')
-    print('    Show this help message')
-    print('    Example: python run.py help')
-    print()
-    print('  run')
-    print('    Start the web server (default: port 5555)')
-    print('    Example: python run.py run')
-    print()
-    print('Environment Variables:')
-    print('-' * 80)
-    print('  FLASK_ENV      - development, production, or testing (default: development)')
-    print('  SECRET_KEY     - Secret key for session management (required in production)')
-    print('  LOG_LEVEL      - DEBUG, INFO, WARNING, ERROR (default: INFO)')
-    print('  LOG_FILE       - Path to log file (default: logs/wicara.log)')
-    print('  HOST           - Server host (default: 0.0.0.0)')
-    print('  PORT           - Server port (default: 5555)')
-    print()
-    print('Configuration:')
-    print('-' * 80)
-    print('  Config file: config.json')
-    print('  Plugin directory: app/plugins/installed/')
-    print('  For configuration details, see documentation at /docs')
-    print()
+    sys.stdout.write(_HELP_TEXT)
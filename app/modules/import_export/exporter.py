@@ -342,8 +342,8 @@ class Exporter:
 
                 # Validate manifest
                 try:
-                    manifest_data = zip_file.read('manifest.json')
-                    manifest = json.loads(manifest_data)
+                    with zip_file.open('manifest.json') as f:
+                        manifest = json.load(f)
 
                     # Check manifest structure
                     required_keys = ['version', 'export_mode', 'exported_at']
@@ -356,8 +356,8 @@ class Exporter:
 
                 # Validate config
                 try:
-                    config_data = zip_file.read('config.json')
-                    config = json.loads(config_data)
+                    with zip_file.open('config.json') as f:
+                        config = json.load(f)
 
                     if 'sitename' not in config or 'pages' not in config:
                         return False, "Invalid config.json structure"
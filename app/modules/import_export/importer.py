@@ -272,8 +272,8 @@ class Importer:
 
                 # Validate manifest
                 try:
-                    manifest_data = zf.read('manifest.json')
-                    manifest = json.loads(manifest_data)
+                    with zf.open('manifest.json') as f:
+                        manifest = json.load(f)
                     if not isinstance(manifest, dict):
                         return False, "Invalid manifest structure"
                 except (json.JSONDecodeError, KeyError):
@@ -281,8 +281,8 @@ class Importer:
 
                 # Validate config
                 try:
-                    config_data = zf.read('config.json')
-                    config = json.loads(config_data)
+                    with zf.open('config.json') as f:
+                        config = json.load(f)
                     if not isinstance(config, dict):
                         return False, "Invalid config structure"
                     if 'pages' not in config:
@@ -299,8 +299,8 @@ class Importer:
         """Check version and schema compatibility."""
         try:
             with zipfile.ZipFile(zip_path, 'r') as zf:
-                manifest_data = zf.read('manifest.json')
-                manifest = json.loads(manifest_data)
+                with zf.open('manifest.json') as f:
+                    manifest = json.load(f)
 
                 # Get version info
                 export_version = manifest.get('version', '1.0.0')
@@ -331,8 +331,8 @@ class Importer:
         """Load config.json from ZIP file."""
         try:
             with zipfile.ZipFile(zip_path, 'r') as zf:
-                config_data = zf.read('config.json')
-                return json.loads(config_data)
+                with zf.open('config.json') as f:
+                    return json.load(f)
         except (json.JSONDecodeError, KeyError, IOError) as e:
             raise ImportError(f"Failed to load config from ZIP: {str(e)}")
 
@@ -363,34 +363,33 @@ class Importer:
                     merged[setting] = value
                     self.import_stats['settings_updated'] = True
 
-        # Merge pages
+        # Merge pages into a copy of the current list, finding pages by URL
+        # through an index instead of scanning the list for every import
         imported_pages = imported.get('pages', [])
-        current_pages = current.get('pages', [])
+        merged['pages'] = list(current.get('pages', []))
+        url_index = {}
+        for i, page in enumerate(merged['pages']):
+            url_index.setdefault(page.get('url'), i)
 
         for imported_page in imported_pages:
             imported_url = imported_page.get('url')
 
             # Check for existing page with same URL
-            existing_page = next(
-                (p for p in current_pages if p.get('url') == imported_url),
-                None
-            )
+            index = url_index.get(imported_url)
 
-            if existing_page:
+            if index is not None:
                 # Resolve conflict
                 resolved = resolver.resolve_page_conflict(
-                    existing_page,
+                    merged['pages'][index],
                     imported_page
                 )
                 if resolved:
-                    # Replace existing page
-                    merged['pages'] = [
-                        resolved if p.get('url') == imported_url else p
-                        for p in merged['pages']
-                    ]
+                    # Replace existing page in place
+                    merged['pages'][index] = resolved
                     self.import_stats['pages_imported'] += 1
             else:
                 # Add new page
+                url_index[imported_url] = len(merged['pages'])
                 merged['pages'].append(imported_page)
                 self.import_stats['pages_imported'] += 1
 
@@ -413,8 +412,8 @@ class Importer:
                         target_path = os.path.join(self.app_root, file_info.filename)
                         os.makedirs(os.path.dirname(target_path), exist_ok=True)
 
-                        with open(target_path, 'wb') as f:
-                            f.write(zf.read(file_info.filename))
+                        with zf.open(file_info) as src, open(target_path, 'wb') as f:
+                            shutil.copyfileobj(src, f)
 
                         self.import_stats['templates_imported'] += 1
 
@@ -438,8 +437,8 @@ class Importer:
                         target_path = os.path.join(self.app_root, file_info.filename)
                         os.makedirs(os.path.dirname(target_path), exist_ok=True)
 
-                        with open(target_path, 'wb') as f:
-                            f.write(zf.read(file_info.filename))
+                        with zf.open(file_info) as src, open(target_path, 'wb') as f:
+                            shutil.copyfileobj(src, f)
 
                         self.import_stats['images_imported'] += 1
 
@@ -554,12 +553,12 @@ class Importer:
             'settings_changes': {}
         }
 
-        # Check pages
+        # Check pages against the current URLs in one set lookup each
+        current_urls = {p.get('url') for p in current_config.get('pages', [])}
         for imported_page in imported_config.get('pages', []):
             url = imported_page.get('url')
-            exists = any(p.get('url') == url for p in current_config.get('pages', []))
 
-            if exists:
+            if url in current_urls:
                 preview['pages_to_update'] += 1
                 preview['conflicts'].append({
                     'type': 'page_exists',
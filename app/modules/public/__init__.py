@@ -3,6 +3,6 @@ WICARA Public Module
 Handles public-facing pages and content rendering.
 """
 
-from app.modules.public.routes import public_bp
+from app.modules.public.routes import public_bp, register_page_routes
 
-__all__ = ['public_bp']
+__all__ = ['public_bp', 'register_page_routes']
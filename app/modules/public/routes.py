@@ -3,17 +3,28 @@ Public routes for WICARA CMS.
 Handles public-facing pages and content rendering.
 """
 
-from flask import Blueprint, render_template, current_app, request
-from app.core import load_config, render_page_template
+from flask import Blueprint, render_template, current_app, request, make_response
+from werkzeug.exceptions import HTTPException
+import hashlib
+from app.core import render_page_template
 from app.core.config_manager import ConfigManager
+from app.modules.auth.utils import is_admin_logged_in
 from app.modules.public.utils import get_page_by_url
 
 public_bp = Blueprint('public', __name__)
 
+# Rendered HTML per page URL, stored as (config, html, etag). An entry is valid
+# only for the exact config object it was rendered from; ConfigManager hands
+# out a new object whenever config.json changes, which invalidates every entry.
+_RENDER_CACHE = {}
+
 
 def _render_page_content(page_url, page, config):
     """Render page content.
 
+    Public renders are cached per URL until the configuration changes.
+    Logged-in admins always get a fresh render.
+
     Args:
         page_url: The page URL
         page: Page configuration
@@ -22,54 +33,124 @@ def _render_page_content(page_url, page, config):
     Returns:
         Rendered HTML string
     """
-    return render_page_template(page['template'], config, page)
+    if is_admin_logged_in():
+        return render_page_template(page['template'], config, page)
 
+    cached = _RENDER_CACHE.get(page_url)
+    if cached is not None and cached[0] is config:
+        return cached[1]
 
-@public_bp.route('/')
-def index():
+    html = render_page_template(page['template'], config, page)
+    # Error renders come back as (html, status) tuples and are not cached
+    if isinstance(html, str):
+        etag = hashlib.blake2b(html.encode('utf-8'), digest_size=16).hexdigest()
+        _RENDER_CACHE[page_url] = (config, html, etag)
+    return html
+
+
+def _conditional_page_response(page_url, page, config):
+    """Serve a page with an ETag when no response cache is configured.
+
+    The ETag is a digest of the cached render, so every worker gives the
+    same page the same tag. Browsers revalidate on each visit
+    (Cache-Control: no-cache) and get 304 Not Modified while the page is
+    unchanged. Only called for visitors; _serve_page handles admins first.
+
+    Args:
+        page_url: The page URL
+        page: Page configuration
+        config: Site configuration
+
+    Returns:
+        Flask response
     """
-    Home page route.
+    html = _render_page_content(page_url, page, config)
+    if not isinstance(html, str):
+        return html
 
-    Renders the home page configured in config.json.
-    Integrates response caching for public pages.
+    cached = _RENDER_CACHE.get(page_url)
+    if cached is None or cached[0] is not config:
+        return html
+
+    response = make_response(html)
+    response.set_etag(cached[2])
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _serve_page(page_url):
     """
-    page = get_page_by_url('/')
-    if not page:
-        return render_template('404.html'), 404
+    Look up and serve a configured page.
+
+    Integrates response caching for public pages. Cached responses are
+    dropped when the configuration has changed since the page was last
+    rendered, so admin edits show up without waiting for the TTL.
+    Logged-in admins get a fresh render that is neither cached nor allowed
+    to invalidate what visitors are served.
 
+    Args:
+        page_url: Page URL including leading slash
+
+    Returns:
+        Flask response
+    """
     # ECS-08: Use ConfigManager with site_manager for Engine-Content Separation
     config_manager = ConfigManager(
         site_manager=getattr(current_app, 'site_manager', None),
         logger=current_app.logger
     )
-    config = config_manager.load()
+    config = config_manager.load(readonly=True)
 
     if not config:
         return render_template('500.html'), 500
 
+    page = get_page_by_url(page_url, config)
+    if not page:
+        return render_template('404.html'), 404
+
+    # Admin views bypass every cache: nothing is stored or invalidated for them
+    if is_admin_logged_in():
+        return _render_page_content(page_url, page, config)
+
     # Use response caching if available
     if hasattr(current_app, 'cache_service') and current_app.cache_service:
         response_cache = current_app.cache_service.response_cache
         if response_cache:
-            response = response_cache.cache_response(
-                '/',
-                lambda: _render_page_content('/', page, config),
-                ttl=3600,
-                public=True,
-            )
+            cached = _RENDER_CACHE.get(page_url)
+            if cached is None or cached[0] is not config:
+                response_cache.invalidate_response(page_url)
 
             # Check for conditional requests (ETag/If-Modified-Since)
             conditional = response_cache.handle_conditional_request(
-                '/',
+                page_url,
                 if_none_match=request.headers.get('If-None-Match'),
                 if_modified_since=request.headers.get('If-Modified-Since'),
             )
             if conditional:
                 return conditional
 
+            response = response_cache.cache_response(
+                page_url,
+                lambda: _render_page_content(page_url, page, config),
+                ttl=3600,
+                public=True,
+                # Quality-aware: "gzip;q=0" is a refusal, "*" an acceptance
+                accept_gzip=request.accept_encodings['gzip'] > 0,
+            )
             return response
 
-    return render_page_template(page['template'], config, page)
+    return _conditional_page_response(page_url, page, config)
+
+
+@public_bp.route('/')
+def index():
+    """
+    Home page route.
+
+    Renders the home page configured in config.json.
+    """
+    return _serve_page('/')
 
 
 @public_bp.route('/<path:url>')
@@ -78,46 +159,61 @@ def page(url):
     Dynamic page route handler.
 
     Renders any page configured in config.json by its URL.
-    Integrates response caching for public pages.
 
     Args:
         url: Page URL path (without leading slash)
     """
-    page = get_page_by_url(f'/{url}')
-    if not page:
-        return render_template('404.html'), 404
+    return _serve_page(f'/{url}')
 
-    # ECS-08: Use ConfigManager with site_manager for Engine-Content Separation
-    config_manager = ConfigManager(
-        site_manager=getattr(current_app, 'site_manager', None),
-        logger=current_app.logger
-    )
-    config = config_manager.load()
 
-    if not config:
-        return render_template('500.html'), 500
+def register_page_routes(app):
+    """
+    Register every configured page URL as a concrete URL rule.
 
-    # Use response caching if available
-    if hasattr(current_app, 'cache_service') and current_app.cache_service:
-        response_cache = current_app.cache_service.response_cache
-        if response_cache:
-            page_url = f'/{url}'
-            response = response_cache.cache_response(
-                page_url,
-                lambda: _render_page_content(page_url, page, config),
-                ttl=3600,
-                public=True,
-            )
+    Static rules are matched by Werkzeug's router before the '/<path:url>'
+    catch-all, so known pages dispatch straight to the page view. The
+    catch-all stays in place for pages added after startup (CLI, import),
+    and the view still resolves the page at request time, so edits and
+    removals take effect without a restart.
 
-            # Check for conditional requests (ETag/If-Modified-Since)
-            conditional = response_cache.handle_conditional_request(
-                page_url,
-                if_none_match=request.headers.get('If-None-Match'),
-                if_modified_since=request.headers.get('If-Modified-Since'),
-            )
-            if conditional:
-                return conditional
+    URLs that already resolve to another endpoint (admin, static, plugins)
+    are left alone.
 
-            return response
+    Args:
+        app: Flask application instance
 
-    return render_page_template(page['template'], config, page)
+    Returns:
+        Number of page rules registered
+    """
+    config_manager = ConfigManager(
+        site_manager=getattr(app, 'site_manager', None),
+        logger=app.logger
+    )
+    config = config_manager.load(readonly=True)
+    if not config:
+        return 0
+
+    adapter = app.url_map.bind('localhost')
+    registered = 0
+
+    for index, page_config in enumerate(config.get('pages', [])):
+        page_url = page_config.get('url')
+        if not page_url or page_url == '/':
+            continue
+
+        try:
+            endpoint, _ = adapter.match(page_url)
+        except HTTPException:
+            continue
+        if endpoint != 'public.page':
+            continue
+
+        app.add_url_rule(
+            page_url,
+            endpoint=f'public_page_{index}',
+            view_func=page,
+            defaults={'url': page_url[1:]},
+        )
+        registered += 1
+
+    return registered
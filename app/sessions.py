@@ -0,0 +1,78 @@
+"""
+Session handling for WICARA CMS.
+Signed cookie sessions serialized with orjson when it is installed.
+"""
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSessionInterface
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+class OrjsonTaggedSerializer(TaggedJSONSerializer):
+    """
+    Flask's tagged session serializer with orjson doing the JSON work.
+
+    Tagging (tuples, bytes, datetimes, Markup) is unchanged, and orjson emits
+    plain compact JSON, so cookies stay readable by the default serializer.
+    """
+
+    def dumps(self, value):
+        """
+        Tag and serialize session data.
+
+        Args:
+            value: Session data
+
+        Returns:
+            JSON string
+        """
+        try:
+            return orjson.dumps(self.tag(value)).decode('utf-8')
+        except TypeError:
+            # Values orjson rejects (e.g. integers over 64 bits)
+            return super().dumps(value)
+
+    def loads(self, value):
+        """
+        Deserialize and untag session data.
+
+        Args:
+            value: JSON string or bytes
+
+        Returns:
+            Session data
+        """
+        return self._untag_tree(orjson.loads(value))
+
+    def _untag_tree(self, value):
+        """Untag nested values bottom-up, like json's object_hook."""
+        if isinstance(value, dict):
+            return self.untag({key: self._untag_tree(item) for key, item in value.items()})
+        if isinstance(value, list):
+            return [self._untag_tree(item) for item in value]
+        return value
+
+
+class OrjsonSessionInterface(SecureCookieSessionInterface):
+    """Secure cookie sessions serialized through OrjsonTaggedSerializer."""
+
+    serializer = OrjsonTaggedSerializer()
+
+
+def init_session_interface(app):
+    """
+    Use the orjson session serializer when orjson is available.
+
+    Args:
+        app: Flask application instance
+    """
+    if orjson is None:
+        app.logger.debug("orjson not installed, using default session serializer")
+        return
+
+    app.session_interface = OrjsonSessionInterface()
+    app.logger.info("Session serializer: orjson")
@@ -0,0 +1,72 @@
+"""
+Template loading for WICARA CMS.
+Jinja2 ChoiceLoader that remembers which search path provides each template.
+"""
+
+from jinja2 import ChoiceLoader, TemplateNotFound
+
+
+class CachingChoiceLoader(ChoiceLoader):
+    """
+    ChoiceLoader that goes straight to the loader that last found a template.
+
+    A plain ChoiceLoader probes its loaders in order on every lookup, so an
+    engine template behind the site templates directory costs a failed
+    filesystem lookup first. This loader records the loader that served each
+    name and asks it directly next time. If that loader no longer has the
+    template, the name is resolved again through the full search order.
+
+    Jinja only reloads a cached template when its original file changes, so
+    a template added to an earlier search path later is picked up after a
+    restart, as with the plain ChoiceLoader.
+    """
+
+    def __init__(self, loaders):
+        super().__init__(loaders)
+        self._resolved = {}
+
+    def get_source(self, environment, template):
+        """
+        Get template source from the remembered loader, or search all loaders.
+
+        Args:
+            environment: Jinja2 environment
+            template: Template name
+
+        Returns:
+            Tuple of (source, filename, uptodate)
+        """
+        return self._resolve(template, lambda loader: loader.get_source(environment, template))
+
+    def load(self, environment, name, globals=None):
+        """
+        Load a template through the remembered loader, or search all loaders.
+
+        Args:
+            environment: Jinja2 environment
+            name: Template name
+            globals: Template globals (optional)
+
+        Returns:
+            Compiled Jinja2 template
+        """
+        return self._resolve(name, lambda loader: loader.load(environment, name, globals))
+
+    def _resolve(self, name, call):
+        """Run call(loader) on the loader that has template name."""
+        loader = self._resolved.get(name)
+        if loader is not None:
+            try:
+                return call(loader)
+            except TemplateNotFound:
+                self._resolved.pop(name, None)
+
+        for loader in self.loaders:
+            try:
+                result = call(loader)
+            except TemplateNotFound:
+                continue
+            self._resolved[name] = loader
+            return result
+
+        raise TemplateNotFound(name)
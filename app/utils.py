@@ -9,31 +9,22 @@ import shutil
 import uuid
 from pathlib import Path
 
-
-def convert_keys_to_underscore(data):
-    """
-    Recursively convert dictionary keys with hyphens to underscores for Jinja2 compatibility.
-
-    Args:
-        data: Dictionary, list, or primitive value to convert
-
-    Returns:
-        Converted data with underscores instead of hyphens in keys
-    """
-    if isinstance(data, dict):
-        new_dict = {}
-        for key, value in data.items():
-            # Convert hyphens to underscores in keys
-            new_key = key.replace('-', '_')
-            # Recursively convert nested dictionaries
-            new_dict[new_key] = convert_keys_to_underscore(value)
-        return new_dict
-    elif isinstance(data, list):
-        # Recursively process list items
-        return [convert_keys_to_underscore(item) for item in data]
-    else:
-        # Return primitive values as-is
-        return data
+# Shared with the core template manager (iterative, str.translate based)
+from app.core.template_manager import convert_keys_to_underscore
+
+__all__ = [
+    'sanitize_filename',
+    'validate_field_value',
+    'validate_image_file',
+    'load_config',
+    'save_config',
+    'create_default_config',
+    'cleanup_unused_images',
+    'validate_config_schema',
+    'validate_page_schema',
+    'validate_field_schema',
+    'convert_keys_to_underscore',
+]
 
 
 def sanitize_filename(filename):
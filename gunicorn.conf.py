@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for WICARA CMS.
+
+Picked up automatically when gunicorn is started from the project root:
+
+    gunicorn "app:create_app()"
+
+Every setting can be overridden with environment variables or command line flags.
+"""
+
+import multiprocessing
+import os
+
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5555')}"
+
+# One process per core, each with a few threads for requests waiting on I/O
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+
+# Build the app once in the master: config, page routes and compiled templates
+# are loaded before forking and shared copy-on-write by every worker
+preload_app = True
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
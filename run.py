@@ -9,15 +9,6 @@ import os
 import sys
 from pathlib import Path
 
-from app import create_app
-from app.core.site_manager import SiteManager
-from app.modules.cli import (
-    create_page, list_pages, delete_page, change_password, show_help,
-    plugin_list, plugin_install, plugin_uninstall, plugin_enable, plugin_disable,
-    plugin_info, plugin_create, plugin_validate, plugin_package,
-    hook_list, hook_handlers, hook_stats
-)
-
 
 # ============================================================================
 # Environment Configuration with .env Support
@@ -66,7 +57,7 @@ def load_env_file(env_file='.env'):
 
         return count
     except Exception as e:
-        print(f'Warning: Could not load .env file: {e}')
+        print(f'Warning: Could not load .env file: {e}', file=sys.stderr)
         return count
 
 
@@ -76,6 +67,9 @@ def load_env_file(env_file='.env'):
 
 def run_server():
     """Start the Flask development server with hot reload in development mode."""
+    # Imported here so CLI commands do not build the import graph of the web app
+    from app import create_app
+
     app = create_app()
     host = os.environ.get('HOST', '0.0.0.0')
     port = int(os.environ.get('PORT', 5555))
@@ -87,175 +81,285 @@ def run_server():
 
 
 # ============================================================================
-# Main Entry Point
+# CLI Commands
 # ============================================================================
+# Each command takes the arguments after the command name and the --quiet
+# flag, and returns the process exit status (None for success). Modules are
+# imported inside the command so each one only loads what it needs.
 
-def main():
-    """Main entry point for CLI."""
-    # Load .env file if it exists (ARC-04)
-    env_loaded = load_env_file('.env')
-    if env_loaded > 0:
-        print(f'Loaded {env_loaded} environment variable(s) from .env file')
+def _usage_error(*lines):
+    """Print an argument error to stderr and return the failure exit status."""
+    for line in lines:
+        print(line, file=sys.stderr)
+    return 1
+
+
+def _site_manager():
+    """Build the SiteManager for CLI context from the environment (ECS-10)."""
+    from app.core.site_manager import SiteManager
 
-    # Initialize SiteManager for CLI context (ECS-10)
     # Use environment variable LEGACY_MODE to determine mode (defaults to True for backward compatibility)
     legacy_mode = os.environ.get('LEGACY_MODE', 'true').lower() in ['true', '1', 'yes']
     sites_dir = os.environ.get('SITES_DIR', 'sites')
     default_site = os.environ.get('DEFAULT_SITE', 'default')
 
-    site_manager = SiteManager(
+    return SiteManager(
         sites_dir=sites_dir,
         default_site=default_site,
         legacy_mode=legacy_mode
     )
 
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-
-        if command == 'create-page':
-            if len(sys.argv) < 5:
-                print('Error: Missing arguments')
-                print('Usage: python run.py create-page <title> <template> <url> [menu-title]')
-                sys.exit(1)
-            title = sys.argv[2]
-            template = sys.argv[3]
-            url = sys.argv[4]
-            menu_title = sys.argv[5] if len(sys.argv) > 5 else None
-            success = create_page(title, template, url, menu_title, site_manager=site_manager)
-            sys.exit(0 if success else 1)
-
-        elif command == 'list-pages':
-            list_pages(site_manager=site_manager)
-
-        elif command == 'delete-page':
-            if len(sys.argv) < 3:
-                print('Error: Missing URL argument')
-                print('Usage: python run.py delete-page <url>')
-                sys.exit(1)
-            url = sys.argv[2]
-            success = delete_page(url, site_manager=site_manager)
-            sys.exit(0 if success else 1)
-
-        elif command == 'change-password':
-            new_password = sys.argv[2] if len(sys.argv) > 2 else None
-            success = change_password(new_password, site_manager=site_manager)
-            sys.exit(0 if success else 1)
-
-        elif command == 'help':
-            show_help()
-
-        elif command == 'run':
-            run_server()
-
-        # Plugin Management Commands
-        elif command == 'plugin-list':
-            plugin_list()
-
-        elif command == 'plugin-install':
-            if len(sys.argv) < 3:
-                print('Error: Missing source argument')
-                print('Usage: python run.py plugin-install <source>')
-                print('  source: Path to ZIP file or plugin directory')
-                sys.exit(1)
-            source = sys.argv[2]
-            success = plugin_install(source)
-            sys.exit(0 if success else 1)
-
-        elif command == 'plugin-uninstall':
-            if len(sys.argv) < 3:
-                print('Error: Missing plugin name argument')
-                print('Usage: python run.py plugin-uninstall <name> [--force]')
-                sys.exit(1)
-            plugin_name = sys.argv[2]
-            force = '--force' in sys.argv or '-f' in sys.argv
-            success = plugin_uninstall(plugin_name, force)
-            sys.exit(0 if success else 1)
-
-        elif command == 'plugin-enable':
-            if len(sys.argv) < 3:
-                print('Error: Missing plugin name argument')
-                print('Usage: python run.py plugin-enable <name>')
-                sys.exit(1)
-            plugin_name = sys.argv[2]
-            success = plugin_enable(plugin_name)
-            sys.exit(0 if success else 1)
-
-        elif command == 'plugin-disable':
-            if len(sys.argv) < 3:
-                print('Error: Missing plugin name argument')
-                print('Usage: python run.py plugin-disable <name>')
-                sys.exit(1)
-            plugin_name = sys.argv[2]
-            success = plugin_disable(plugin_name)
-            sys.exit(0 if success else 1)
-
-        elif command == 'plugin-info':
-            if len(sys.argv) < 3:
-                print('Error: Missing plugin name argument')
-                print('Usage: python run.py plugin-info <name>')
-                sys.exit(1)
-            plugin_name = sys.argv[2]
-            success = plugin_info(plugin_name)
-            sys.exit(0 if success else 1)
-
-        # Plugin Development Commands
-        elif command == 'plugin-create':
-            success = plugin_create()
-            sys.exit(0 if success else 1)
-
-        elif command == 'plugin-validate':
-            if len(sys.argv) < 3:
-                print('Error: Missing plugin name argument')
-                print('Usage: python run.py plugin-validate <name>')
-                sys.exit(1)
-            plugin_name = sys.argv[2]
-            success = plugin_validate(plugin_name)
-            sys.exit(0 if success else 1)
-
-        elif command == 'plugin-package':
-            if len(sys.argv) < 3:
-                print('Error: Missing plugin name argument')
-                print('Usage: python run.py plugin-package <name>')
-                sys.exit(1)
-            plugin_name = sys.argv[2]
-            success = plugin_package(plugin_name)
-            sys.exit(0 if success else 1)
-
-        # Hook Inspection Commands
-        elif command == 'hook-list':
-            hook_list()
-
-        elif command == 'hook-handlers':
-            if len(sys.argv) < 3:
-                print('Error: Missing hook name argument')
-                print('Usage: python run.py hook-handlers <hook-name>')
-                sys.exit(1)
-            hook_name = sys.argv[2]
-            success = hook_handlers(hook_name)
-            sys.exit(0 if success else 1)
-
-        elif command == 'hook-stats':
-            hook_stats()
-
-        elif command == 'migrate':
-            # Import migration script
-            try:
-                sys.path.insert(0, str(Path(__file__).parent))
-                from scripts.migrate_to_sites import migrate_to_sites
-                success = migrate_to_sites()
-                sys.exit(0 if success else 1)
-            except ImportError as e:
-                print(f'Error: Could not import migration script: {e}')
-                print('Make sure scripts/migrate_to_sites.py exists')
-                sys.exit(1)
-
-        else:
-            print(f'Error: Unknown command "{command}"')
-            print('Run "python run.py help" for available commands')
-            sys.exit(1)
-    else:
-        # Default: run the web server
-        run_server()
+
+def _cmd_create_page(args, quiet=False):
+    """Create a page: create-page <title> <template> <url> [menu-title]."""
+    if len(args) < 3:
+        return _usage_error(
+            'Error: Missing arguments',
+            'Usage: python run.py create-page <title> <template> <url> [menu-title]'
+        )
+    from app.modules.cli import create_page
+    title, template, url = args[:3]
+    menu_title = args[3] if len(args) > 3 else None
+    success = create_page(title, template, url, menu_title, site_manager=_site_manager(), quiet=quiet)
+    return 0 if success else 1
+
+
+def _cmd_create_pages(args, quiet=False):
+    """Create every page listed in a JSON batch file."""
+    if not args:
+        return _usage_error(
+            'Error: Missing batch file argument',
+            'Usage: python run.py create-pages <file.json>'
+        )
+    from app.modules.cli import create_pages
+    success = create_pages(args[0], site_manager=_site_manager(), quiet=quiet)
+    return 0 if success else 1
+
+
+def _cmd_list_pages(args, quiet=False):
+    """List all pages."""
+    from app.modules.cli import list_pages
+    list_pages(site_manager=_site_manager())
+
+
+def _cmd_delete_page(args, quiet=False):
+    """Delete the page at a URL."""
+    if not args:
+        return _usage_error(
+            'Error: Missing URL argument',
+            'Usage: python run.py delete-page <url>'
+        )
+    from app.modules.cli import delete_page
+    success = delete_page(args[0], site_manager=_site_manager(), quiet=quiet)
+    return 0 if success else 1
+
+
+def _cmd_change_password(args, quiet=False):
+    """Change the admin password, prompting when none is given."""
+    from app.modules.cli import change_password
+    new_password = args[0] if args else None
+    success = change_password(new_password, site_manager=_site_manager(), quiet=quiet)
+    return 0 if success else 1
+
+
+def _cmd_help(args, quiet=False):
+    """Show CLI help."""
+    from app.modules.cli import show_help
+    show_help()
+
+
+def _cmd_run(args, quiet=False):
+    """Start the web server."""
+    run_server()
+
+
+# Plugin Management Commands
+
+def _cmd_plugin_list(args, quiet=False):
+    """List installed plugins."""
+    from app.modules.cli import plugin_list
+    plugin_list()
+
+
+def _cmd_plugin_install(args, quiet=False):
+    """Install a plugin from a ZIP file or directory."""
+    if not args:
+        return _usage_error(
+            'Error: Missing source argument',
+            'Usage: python run.py plugin-install <source>',
+            '  source: Path to ZIP file or plugin directory'
+        )
+    from app.modules.cli import plugin_install
+    return 0 if plugin_install(args[0]) else 1
+
+
+def _cmd_plugin_uninstall(args, quiet=False):
+    """Uninstall a plugin, with --force to skip confirmation."""
+    if not args:
+        return _usage_error(
+            'Error: Missing plugin name argument',
+            'Usage: python run.py plugin-uninstall <name> [--force]'
+        )
+    from app.modules.cli import plugin_uninstall
+    force = '--force' in args or '-f' in args
+    return 0 if plugin_uninstall(args[0], force) else 1
+
+
+def _cmd_plugin_enable(args, quiet=False):
+    """Enable a plugin."""
+    if not args:
+        return _usage_error(
+            'Error: Missing plugin name argument',
+            'Usage: python run.py plugin-enable <name>'
+        )
+    from app.modules.cli import plugin_enable
+    return 0 if plugin_enable(args[0]) else 1
+
+
+def _cmd_plugin_disable(args, quiet=False):
+    """Disable a plugin."""
+    if not args:
+        return _usage_error(
+            'Error: Missing plugin name argument',
+            'Usage: python run.py plugin-disable <name>'
+        )
+    from app.modules.cli import plugin_disable
+    return 0 if plugin_disable(args[0]) else 1
+
+
+def _cmd_plugin_info(args, quiet=False):
+    """Show plugin details."""
+    if not args:
+        return _usage_error(
+            'Error: Missing plugin name argument',
+            'Usage: python run.py plugin-info <name>'
+        )
+    from app.modules.cli import plugin_info
+    return 0 if plugin_info(args[0]) else 1
+
+
+# Plugin Development Commands
+
+def _cmd_plugin_create(args, quiet=False):
+    """Scaffold a new plugin interactively."""
+    from app.modules.cli import plugin_create
+    return 0 if plugin_create() else 1
+
+
+def _cmd_plugin_validate(args, quiet=False):
+    """Validate a plugin."""
+    if not args:
+        return _usage_error(
+            'Error: Missing plugin name argument',
+            'Usage: python run.py plugin-validate <name>'
+        )
+    from app.modules.cli import plugin_validate
+    return 0 if plugin_validate(args[0]) else 1
+
+
+def _cmd_plugin_package(args, quiet=False):
+    """Package a plugin for distribution."""
+    if not args:
+        return _usage_error(
+            'Error: Missing plugin name argument',
+            'Usage: python run.py plugin-package <name>'
+        )
+    from app.modules.cli import plugin_package
+    return 0 if plugin_package(args[0]) else 1
+
+
+# Hook Inspection Commands
+
+def _cmd_hook_list(args, quiet=False):
+    """List available hooks."""
+    from app.modules.cli import hook_list
+    hook_list()
+
+
+def _cmd_hook_handlers(args, quiet=False):
+    """List the handlers registered for a hook."""
+    if not args:
+        return _usage_error(
+            'Error: Missing hook name argument',
+            'Usage: python run.py hook-handlers <hook-name>'
+        )
+    from app.modules.cli import hook_handlers
+    return 0 if hook_handlers(args[0]) else 1
+
+
+def _cmd_hook_stats(args, quiet=False):
+    """Show hook statistics."""
+    from app.modules.cli import hook_stats
+    hook_stats()
+
+
+def _cmd_migrate(args, quiet=False):
+    """Migrate a legacy install to the sites/ layout."""
+    # Import migration script
+    try:
+        sys.path.insert(0, str(Path(__file__).parent))
+        from scripts.migrate_to_sites import migrate_to_sites
+    except ImportError as e:
+        return _usage_error(
+            f'Error: Could not import migration script: {e}',
+            'Make sure scripts/migrate_to_sites.py exists'
+        )
+    return 0 if migrate_to_sites() else 1
+
+
+COMMANDS = {
+    'create-page': _cmd_create_page,
+    'create-pages': _cmd_create_pages,
+    'list-pages': _cmd_list_pages,
+    'delete-page': _cmd_delete_page,
+    'change-password': _cmd_change_password,
+    'help': _cmd_help,
+    'run': _cmd_run,
+    'plugin-list': _cmd_plugin_list,
+    'plugin-install': _cmd_plugin_install,
+    'plugin-uninstall': _cmd_plugin_uninstall,
+    'plugin-enable': _cmd_plugin_enable,
+    'plugin-disable': _cmd_plugin_disable,
+    'plugin-info': _cmd_plugin_info,
+    'plugin-create': _cmd_plugin_create,
+    'plugin-validate': _cmd_plugin_validate,
+    'plugin-package': _cmd_plugin_package,
+    'hook-list': _cmd_hook_list,
+    'hook-handlers': _cmd_hook_handlers,
+    'hook-stats': _cmd_hook_stats,
+    'migrate': _cmd_migrate,
+}
+
+
+# ============================================================================
+# Main Entry Point
+# ============================================================================
+
+def main():
+    """Main entry point for CLI."""
+    # --quiet silences the .env banner and success messages of page and
+    # password commands, so scripted output carries only data
+    args = sys.argv[1:]
+    quiet = '--quiet' in args
+    if quiet:
+        args = [arg for arg in args if arg != '--quiet']
+
+    # Load .env file if it exists (ARC-04)
+    env_loaded = load_env_file('.env')
+    if env_loaded > 0 and not quiet:
+        print(f'Loaded {env_loaded} environment variable(s) from .env file')
+
+    # Default: run the web server
+    command = args[0] if args else 'run'
+    handler = COMMANDS.get(command)
+    if handler is None:
+        print(f'Error: Unknown command "{command}"', file=sys.stderr)
+        print('Run "python run.py help" for available commands', file=sys.stderr)
+        sys.exit(1)
+
+    status = handler(args[1:], quiet=quiet)
+    if status:
+        sys.exit(status)
 
 
 if __name__ == '__main__':
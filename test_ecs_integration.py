@@ -9,11 +9,11 @@ Tests:
 - ECS-06: TemplateManager with ChoiceLoader
 """
 
+import io
 import os
 import sys
 import tempfile
 import shutil
-from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -109,9 +109,7 @@ def test_ecs05_file_manager():
         class MockFile:
             def __init__(self, filename):
                 self.filename = filename
-
-            def save(self, path):
-                Path(path).touch()
+                self.stream = io.BytesIO(filename.encode())
 
         mock_file = MockFile('test_image.jpg')
         file_path, unique_filename = save_upload_file(mock_file, upload_folder=upload_dir)
@@ -120,6 +118,12 @@ def test_ecs05_file_manager():
         assert 'test_image.jpg' in unique_filename, "Filename not preserved"
         print(f"   ✓ Legacy mode save works (saved to: {file_path})")
 
+        # Identical re-upload reuses the stored file
+        dup_path, dup_filename = save_upload_file(MockFile('test_image.jpg'), upload_folder=upload_dir)
+        assert dup_path == file_path, "Identical upload was not deduplicated"
+        assert len(os.listdir(upload_dir)) == 1, "Duplicate or temporary file left behind"
+        print("   ✓ Identical uploads are deduplicated")
+
         # Test 2: Sites mode with SiteManager
         print("\n[2] Testing sites mode file operations...")
         sites_dir = os.path.join(tmpdir, 'sites')